@@ -0,0 +1,164 @@
+"""Скользящие итоги тренировок по спортсменам."""
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from homework import InfoMessage, read_package
+
+# Название окна: (длина окна, шаг корзины) в секундах.
+DEFAULT_WINDOWS: Dict[str, Tuple[int, int]] = {'hour': (3600, 60),
+                                               'day': (86400, 900),
+                                               'week': (604800, 3600),
+                                               }
+
+COUNT, DISTANCE, CALORIES, DURATION, SPEED = range(5)
+
+
+@dataclass
+class WindowTotals:
+    """Итоги за окно."""
+    count: int
+    distance: float
+    calories: float
+    duration: float
+    mean_speed: float
+
+
+class _Window:
+    """Корзины одного окна с поддерживаемыми суммами.
+
+    Корзина — список `[начало, count, distance, calories, duration,
+    speed]`; суммы по всем корзинам хранятся в `totals`.
+    """
+
+    __slots__ = ('length', 'step', 'buckets', 'totals')
+
+    def __init__(self, length: int, step: int) -> None:
+        self.length: int = length
+        self.step: int = step
+        self.buckets: Deque[List[float]] = deque()
+        self.totals: List[float] = [0, 0.0, 0.0, 0.0, 0.0]
+
+    def evict(self, now: float) -> None:
+        """Выбросить корзины, целиком вышедшие из окна."""
+        border: float = now - self.length
+        buckets = self.buckets
+        totals = self.totals
+        while buckets and buckets[0][0] + self.step <= border:
+            bucket = buckets.popleft()
+            for field in range(5):
+                totals[field] -= bucket[field + 1]
+
+    def add(self, timestamp: float, values: Sequence[float]) -> None:
+        """Добавить событие в корзину, соответствующую времени."""
+        start: float = timestamp - timestamp % self.step
+        buckets = self.buckets
+        if buckets and buckets[-1][0] == start:
+            bucket = buckets[-1]
+        elif not buckets or buckets[-1][0] < start:
+            bucket = [start, 0, 0.0, 0.0, 0.0, 0.0]
+            buckets.append(bucket)
+        else:
+            bucket = self._late_bucket(start)
+            if bucket is None:
+                return
+        for field in range(5):
+            bucket[field + 1] += values[field]
+            self.totals[field] += values[field]
+
+    def _late_bucket(self, start: float) -> Optional[List[float]]:
+        """Найти или вставить корзину для опоздавшего события."""
+        if start + self.step <= self.buckets[-1][0] - self.length:
+            return None
+        for position in range(len(self.buckets) - 1, -1, -1):
+            bucket = self.buckets[position]
+            if bucket[0] == start:
+                return bucket
+            if bucket[0] < start:
+                break
+        else:
+            position = -1
+        bucket = [start, 0, 0.0, 0.0, 0.0, 0.0]
+        self.buckets.insert(position + 1, bucket)
+        return bucket
+
+    def result(self) -> WindowTotals:
+        """Текущие итоги окна."""
+        count, distance, calories, duration, speed = self.totals
+        count = int(count)
+        return WindowTotals(count=count,
+                            distance=distance if count else 0.0,
+                            calories=calories if count else 0.0,
+                            duration=duration if count else 0.0,
+                            mean_speed=speed / count if count else 0.0,
+                            )
+
+
+class RollingAggregator:
+    """Инкрементальные итоги по спортсмену и типу тренировки.
+
+    Каждое событие обновляет суммы всех окон за O(1); устаревшие
+    корзины выбрасываются при добавлении и при запросе итогов.
+    Точность границы окна равна шагу корзины.
+    """
+
+    def __init__(self,
+                 windows: Optional[Dict[str, Tuple[int, int]]] = None,
+                 ) -> None:
+        self.windows: Dict[str, Tuple[int, int]] = dict(
+            windows or DEFAULT_WINDOWS
+        )
+        self._state: Dict[Tuple[Hashable, str], Dict[str, _Window]] = {}
+
+    def _windows_for(self, key: Tuple[Hashable, str]) -> Dict[str, _Window]:
+        state = self._state.get(key)
+        if state is None:
+            state = {name: _Window(length, step)
+                     for name, (length, step) in self.windows.items()}
+            self._state[key] = state
+        return state
+
+    def add(self, athlete: Hashable, info: InfoMessage,
+            timestamp: Optional[float] = None) -> None:
+        """Учесть готовое сообщение о тренировке."""
+        if timestamp is None:
+            timestamp = time.time()
+        values: Tuple[float, ...] = (1, info.distance, info.calories,
+                                     info.duration, info.speed)
+        for window in self._windows_for((athlete,
+                                         info.training_type)).values():
+            window.evict(timestamp)
+            window.add(timestamp, values)
+
+    def add_package(self, athlete: Hashable, workout_type: str,
+                    data: Sequence[float],
+                    timestamp: Optional[float] = None) -> InfoMessage:
+        """Рассчитать пакет и учесть результат."""
+        info: InfoMessage = read_package(workout_type,
+                                         data).show_training_info()
+        self.add(athlete, info, timestamp)
+        return info
+
+    def totals(self, athlete: Hashable, training_type: str,
+               window: str, now: Optional[float] = None) -> WindowTotals:
+        """Итоги спортсмена по типу тренировки за окно `window`."""
+        if window not in self.windows:
+            raise ValueError(f'Неизвестное окно: {window!r}')
+        state = self._state.get((athlete, training_type))
+        if state is None:
+            return WindowTotals(0, 0.0, 0.0, 0.0, 0.0)
+        current: _Window = state[window]
+        current.evict(time.time() if now is None else now)
+        return current.result()
+
+    def snapshot(self, now: Optional[float] = None,
+                 ) -> Dict[Tuple[Hashable, str, str], WindowTotals]:
+        """Итоги всех спортсменов, типов тренировок и окон."""
+        now = time.time() if now is None else now
+        result: Dict[Tuple[Hashable, str, str], WindowTotals] = {}
+        for (athlete, training_type), state in self._state.items():
+            for name, window in state.items():
+                window.evict(now)
+                result[(athlete, training_type, name)] = window.result()
+        return result
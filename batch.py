@@ -0,0 +1,322 @@
+"""Пакетный расчёт показателей тренировок по колонкам данных.
+
+Если установлен NumPy (`requirements-optional.txt`), группы пакетов
+считаются операциями над массивами; иначе — ядрами на чистом Python.
+Оба пути повторяют порядок операций методов классов и дают те же
+числа до последнего бита.
+"""
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from homework import (WORKOUT_FIELDS, WORKOUT_TYPES, Running, SportsWalking,
+                      Swimming, Training)
+
+Columns = Sequence[Sequence[float]]
+KernelResult = Tuple[List[float], List[float], List[float]]
+RESULT_NAMES: Tuple[str, ...] = ('distance', 'speed', 'calories')
+
+WORKOUT_CLASSES: Dict[str, Type[Training]] = WORKOUT_TYPES
+
+
+@lru_cache(maxsize=None)
+def load_numpy() -> Any:
+    """Модуль NumPy или `None`, если он не установлен."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _distance(cls: Type[Training],
+              action: Sequence[float],
+              ) -> List[float]:
+    """Дистанция в км по формуле `Training.get_distance`."""
+    len_step: float = cls.LEN_STEP
+    m_in_km: float = cls.M_IN_KM
+    return [act * len_step / m_in_km for act in action]
+
+
+def _training_speed(distance: Sequence[float],
+                    duration: Sequence[float],
+                    ) -> List[float]:
+    """Средняя скорость по формуле `Training.get_mean_speed`."""
+    return [dist / dur for dist, dur in zip(distance, duration)]
+
+
+def running_kernel(cls: Type[Running], columns: Columns) -> KernelResult:
+    """Рассчитать группу беговых тренировок."""
+    action, duration, weight = columns[:3]
+    distance: List[float] = _distance(cls, action)
+    speed: List[float] = _training_speed(distance, duration)
+    multiplier: float = cls.CAL_MULTIPLIER
+    shift: float = cls.СAL_SHIFT
+    m_in_km: float = cls.M_IN_KM
+    min_in_hour: int = cls.MIN_IN_HOUR
+    calories: List[float] = [
+        (multiplier * spd - shift) * wgt / m_in_km * (dur * min_in_hour)
+        for spd, dur, wgt in zip(speed, duration, weight)
+    ]
+    return distance, speed, calories
+
+
+def walking_batch(action: Sequence[float],
+                  duration: Sequence[float],
+                  weight: Sequence[float],
+                  height: Sequence[float],
+                  cls: Type[SportsWalking] = SportsWalking,
+                  use_numpy: Optional[bool] = None,
+                  ) -> KernelResult:
+    """Рассчитать колонки тренировок спортивной ходьбой.
+
+    Слагаемое `mean_speed ** 2 // height` считается тем же оператором
+    `//` над float, что и в `SportsWalking.get_spent_calories`, то есть
+    с округлением частного вниз после поправки по остатку. Замена на
+    `floor(x / y)` или `x * x` может разойтись с классом в последнем
+    бите, поэтому порядок операций повторяет скалярную формулу.
+
+    Если установлен NumPy, считается ядром `numpy_walking_kernel`;
+    `use_numpy` позволяет выбрать путь явно, как в `compute_batch`.
+    """
+    numpy = load_numpy() if use_numpy is not False else None
+    if use_numpy and numpy is None:
+        raise RuntimeError('NumPy не установлен')
+    if numpy is None:
+        return _walking_python(cls, action, duration, weight, height)
+    group = numpy.array([action, duration, weight, height],
+                        dtype=numpy.float64)
+    distance, speed, calories = numpy_walking_kernel(cls, group)
+    return distance.tolist(), speed.tolist(), calories.tolist()
+
+
+def _walking_python(cls: Type[SportsWalking],
+                    action: Sequence[float],
+                    duration: Sequence[float],
+                    weight: Sequence[float],
+                    height: Sequence[float],
+                    ) -> KernelResult:
+    distance: List[float] = _distance(cls, action)
+    speed: List[float] = _training_speed(distance, duration)
+    multiplier_1: float = cls.WEIGHT_MULTIPLIER_1
+    multiplier_2: float = cls.WEIGHT_MULTIPLIER_2
+    min_in_hour: int = cls.MIN_IN_HOUR
+    calories: List[float] = [
+        (multiplier_1 * wgt + (spd ** 2 // hgt) * multiplier_2 * wgt)
+        * (dur * min_in_hour)
+        for spd, dur, wgt, hgt in zip(speed, duration, weight, height)
+    ]
+    return distance, speed, calories
+
+
+def walking_kernel(cls: Type[SportsWalking], columns: Columns) -> KernelResult:
+    """Рассчитать группу тренировок спортивной ходьбой."""
+    return _walking_python(cls, *columns[:4])
+
+
+def swimming_kernel(cls: Type[Swimming], columns: Columns) -> KernelResult:
+    """Рассчитать группу тренировок плаванием."""
+    action, duration, weight, length_pool, count_pool = columns[:5]
+    distance: List[float] = _distance(cls, action)
+    m_in_km: float = cls.M_IN_KM
+    speed: List[float] = [
+        length * count / m_in_km / dur
+        for length, count, dur in zip(length_pool, count_pool, duration)
+    ]
+    shift: float = cls.CAL_SHIFT
+    multiplier: float = cls.CAL_MULTIPLIER
+    calories: List[float] = [(spd + shift) * multiplier * wgt
+                             for spd, wgt in zip(speed, weight)]
+    return distance, speed, calories
+
+
+BATCH_KERNELS: Dict[Type[Training], Callable[..., KernelResult]] = {
+    Running: running_kernel,
+    SportsWalking: walking_kernel,
+    Swimming: swimming_kernel,
+}
+
+
+def _check_divisor(divisor: Any) -> None:
+    """Поднять `ZeroDivisionError`, как скалярная формула, а не вернуть inf.
+
+    Без проверки NumPy на делении на ноль только предупреждает и
+    возвращает `inf`/`nan`.
+    """
+    if not divisor.all():
+        raise ZeroDivisionError('float division by zero')
+
+
+def numpy_running_kernel(cls: Type[Running], group: Any) -> Any:
+    """Беговые тренировки над массивами NumPy."""
+    action, duration, weight = group[:3]
+    _check_divisor(duration)
+    distance = action * cls.LEN_STEP / cls.M_IN_KM
+    speed = distance / duration
+    calories = ((cls.CAL_MULTIPLIER * speed - cls.СAL_SHIFT) * weight
+                / cls.M_IN_KM * (duration * cls.MIN_IN_HOUR))
+    return distance, speed, calories
+
+
+def numpy_walking_kernel(cls: Type[SportsWalking], group: Any) -> Any:
+    """Спортивная ходьба над массивами NumPy.
+
+    `numpy.floor_divide` для float устроен как `//` в Python (частное
+    с поправкой по остатку), поэтому результат совпадает с классом.
+    Переполнение квадрата скорости, как и `float ** 2` в Python,
+    вызывает `OverflowError`.
+    """
+    numpy = load_numpy()
+    action, duration, weight, height = group[:4]
+    _check_divisor(duration)
+    _check_divisor(height)
+    distance = action * cls.LEN_STEP / cls.M_IN_KM
+    speed = distance / duration
+    with numpy.errstate(over='ignore'):
+        squared = speed ** 2
+    if (numpy.isinf(squared) & numpy.isfinite(speed)).any():
+        raise OverflowError('Numerical result out of range')
+    calories = ((cls.WEIGHT_MULTIPLIER_1 * weight
+                 + numpy.floor_divide(squared, height)
+                 * cls.WEIGHT_MULTIPLIER_2 * weight)
+                * (duration * cls.MIN_IN_HOUR))
+    return distance, speed, calories
+
+
+def numpy_swimming_kernel(cls: Type[Swimming], group: Any) -> Any:
+    """Тренировки плаванием над массивами NumPy."""
+    action, duration, weight, length_pool, count_pool = group[:5]
+    _check_divisor(duration)
+    distance = action * cls.LEN_STEP / cls.M_IN_KM
+    speed = length_pool * count_pool / cls.M_IN_KM / duration
+    calories = (speed + cls.CAL_SHIFT) * cls.CAL_MULTIPLIER * weight
+    return distance, speed, calories
+
+
+NUMPY_KERNELS: Dict[Type[Training], Callable[..., Any]] = {
+    Running: numpy_running_kernel,
+    SportsWalking: numpy_walking_kernel,
+    Swimming: numpy_swimming_kernel,
+}
+
+
+def group_indexes(workout_types: Sequence[str]) -> Dict[str, List[int]]:
+    """Сгруппировать номера пакетов по коду тренировки."""
+    groups: Dict[str, List[int]] = {}
+    for index, workout_type in enumerate(workout_types):
+        groups.setdefault(workout_type, []).append(index)
+    return groups
+
+
+def _workout_class(workout_type: str) -> Type[Training]:
+    if workout_type not in WORKOUT_CLASSES:
+        raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+    return WORKOUT_CLASSES[workout_type]
+
+
+def _compute_python(workout_types: Sequence[str],
+                    columns: Columns,
+                    ) -> Dict[str, array]:
+    size: int = len(workout_types)
+    result: Dict[str, array] = {
+        name: array('d', bytes(8 * size)) for name in RESULT_NAMES
+    }
+    for workout_type, indexes in group_indexes(workout_types).items():
+        cls: Type[Training] = _workout_class(workout_type)
+        group: List[List[float]] = [[column[i] for i in indexes]
+                                    for column in columns]
+        computed: KernelResult = BATCH_KERNELS[cls](cls, group)
+        for name, values in zip(RESULT_NAMES, computed):
+            target: array = result[name]
+            for index, value in zip(indexes, values):
+                target[index] = value
+    return result
+
+
+def _compute_numpy(numpy: Any, workout_types: Sequence[str],
+                   columns: Columns,
+                   ) -> Dict[str, array]:
+    size: int = len(workout_types)
+    known: List[str] = list(WORKOUT_CLASSES)
+    code_indexes: Dict[str, int] = {code: index
+                                    for index, code in enumerate(known)}
+    unknown: int = len(known)
+    codes = numpy.fromiter((code_indexes.get(workout_type, unknown)
+                            for workout_type in workout_types),
+                           dtype=numpy.intp, count=size)
+    counts = numpy.bincount(codes, minlength=unknown + 1)
+    if counts[unknown]:
+        _workout_class(workout_types[int(numpy.argmax(codes == unknown))])
+    matrix = numpy.empty((len(columns), size))
+    for position, column in enumerate(columns):
+        matrix[position] = numpy.asarray(column, dtype=numpy.float64)
+    computed = numpy.zeros((len(RESULT_NAMES), size))
+    for code_index, workout_type in enumerate(known):
+        if not counts[code_index]:
+            continue
+        cls: Type[Training] = WORKOUT_CLASSES[workout_type]
+        if counts[code_index] == size:
+            computed[:] = NUMPY_KERNELS[cls](cls, matrix)
+            break
+        selected = numpy.flatnonzero(codes == code_index)
+        for target, values in zip(computed,
+                                  NUMPY_KERNELS[cls](cls,
+                                                     matrix[:, selected])):
+            target[selected] = values
+    return {name: array('d', values.tobytes())
+            for name, values in zip(RESULT_NAMES, computed)}
+
+
+def compute_batch(workout_types: Sequence[str],
+                  columns: Columns,
+                  use_numpy: Optional[bool] = None,
+                  ) -> Dict[str, array]:
+    """Рассчитать дистанцию, скорость и калории для набора пакетов.
+
+    `columns[i]` содержит i-е поле данных всех пакетов (action, duration,
+    weight, затем height или length_pool и count_pool); поля, которых нет
+    у тренировки, могут быть заполнены любым числом. Результат — колонки
+    `distance`, `speed` и `calories` в порядке входных пакетов, значения
+    совпадают с методами классов `Training` до последнего бита.
+
+    По умолчанию используется NumPy, если он установлен; `use_numpy`
+    позволяет выбрать путь явно.
+    """
+    numpy = load_numpy() if use_numpy is not False else None
+    if use_numpy and numpy is None:
+        raise RuntimeError('NumPy не установлен')
+    if numpy is None:
+        return _compute_python(workout_types, columns)
+    return _compute_numpy(numpy, workout_types, columns)
+
+
+def packages_to_columns(packages: Sequence[Tuple[str, Sequence[float]]],
+                        width: int = 5,
+                        ) -> Tuple[List[str], List[array]]:
+    """Разложить список пакетов `(workout_type, data)` по колонкам.
+
+    Число значений в пакете известной тренировки проверяется, как при
+    создании объекта в `read_package`; недостающие до `width` колонки
+    заполняются нулями. Неизвестные коды пропускаются как есть, их
+    отклоняет `compute_batch`.
+    """
+    layout: Dict[str, Tuple[int, List[float]]] = {
+        code: (len(fields), [0.0] * (width - len(fields)))
+        for code, fields in WORKOUT_FIELDS.items()
+    }
+    workout_types: List[str] = []
+    values: List[float] = []
+    for workout_type, data in packages:
+        if workout_type in layout:
+            expected, padding = layout[workout_type]
+            if len(data) != expected:
+                raise TypeError(f'Пакет {workout_type!r} должен содержать '
+                                f'{expected} значений, получено {len(data)}')
+        else:
+            data = data[:width]
+            padding = [0.0] * (width - len(data))
+        workout_types.append(workout_type)
+        values += data
+        values += padding
+    return workout_types, [array('d', values[position::width])
+                           for position in range(width)]
@@ -0,0 +1 @@
+"""Бенчмарки модуля расчёта тренировок."""
@@ -0,0 +1,43 @@
+"""Пропускная способность `StreamIngestor` на одном ядре.
+
+Запуск: python -m benchmarks.bench_dedup [count]
+"""
+import random
+import sys
+import time
+from typing import List
+
+from benchmarks.common import synthetic_packages
+from dedup import DevicePackage, StreamIngestor
+
+
+def device_stream(count: int, seed: int = 0) -> List[DevicePackage]:
+    """Поток с 5% повторов и дрожанием времени доставки."""
+    rng = random.Random(seed)
+    pool = synthetic_packages(1000, seed)
+    stream: List[DevicePackage] = []
+    for seq in range(count):
+        device: int = seq % 500
+        timestamp: float = seq * 0.01 + rng.uniform(0, 2)
+        workout_type, data = pool[seq % len(pool)]
+        stream.append((device, seq, timestamp, workout_type, data))
+        if rng.random() < 0.05:
+            stream.append(stream[rng.randrange(max(0, len(stream) - 100),
+                                               len(stream))])
+    return stream
+
+
+def main(count: int = 1_000_000) -> None:
+    stream = device_stream(count)
+    ingestor = StreamIngestor(window=2.0, capacity=count)
+    started: float = time.perf_counter()
+    released: int = len(ingestor.push_many(stream)) + len(ingestor.flush())
+    seconds: float = time.perf_counter() - started
+    print(f'{len(stream):,} пакетов за {seconds:.2f} с: '
+          f'{len(stream) / seconds * 60:,.0f} пакетов/мин, '
+          f'выпущено {released:,}')
+    print(ingestor.stats())
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
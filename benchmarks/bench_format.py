@@ -0,0 +1,38 @@
+"""Сравнение способов форматирования `InfoMessage`.
+
+Запуск: python -m benchmarks.bench_format [count]
+"""
+import io
+import sys
+from dataclasses import asdict
+
+from benchmarks.common import best_of, synthetic_packages
+from formatting import format_messages
+from homework import InfoMessage, read_package
+
+
+def asdict_message(info: InfoMessage) -> str:
+    """Прежняя реализация `get_message` через `asdict`."""
+    return info.INFO_MESSAGE.format(**asdict(info))
+
+
+def main(count: int = 100_000) -> None:
+    infos = [read_package(*package).show_training_info()
+             for package in synthetic_packages(count)]
+    assert [asdict_message(info) for info in infos] == [
+        info.get_message() for info in infos
+    ]
+    cases = [
+        ('asdict + format', lambda: [asdict_message(i) for i in infos]),
+        ('get_message', lambda: [info.get_message() for info in infos]),
+        ('format_messages', lambda: format_messages(infos)),
+        ('format_messages -> file', lambda: format_messages(
+            infos, io.BytesIO())),
+    ]
+    for name, case in cases:
+        seconds: float = best_of(case)
+        print(f'{name:<26}{seconds:8.3f} с{count / seconds:14,.0f} строк/с')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
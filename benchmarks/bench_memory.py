@@ -0,0 +1,51 @@
+"""Сравнение памяти обычных, slotted и колоночных тренировок.
+
+Запуск: python -m benchmarks.bench_memory [count]
+"""
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from benchmarks.common import synthetic_packages
+from homework import read_package
+from records import TrainingColumns, read_slotted_package
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Объём памяти, удерживаемой результатом `build`, в байтах."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count: int = 100_000) -> None:
+    packages = synthetic_packages(count)
+
+    def build_columns() -> TrainingColumns:
+        columns = TrainingColumns()
+        columns.extend(packages)
+        return columns
+
+    cases: List = [
+        ('Training', lambda: [read_package(*p) for p in packages]),
+        ('slotted Training', lambda: [read_slotted_package(*p)
+                                      for p in packages]),
+        ('InfoMessage', lambda: [read_package(*p).show_training_info()
+                                 for p in packages]),
+        ('slotted InfoMessage', lambda: [
+            read_slotted_package(*p).show_training_info() for p in packages
+        ]),
+        ('TrainingColumns', build_columns),
+    ]
+    print(f'{count} тренировок')
+    for name, build in cases:
+        size: int = measure(build)
+        print(f'{name:<22}{size / 2 ** 20:10.2f} МиБ'
+              f'{size / count:10.1f} байт/шт.')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""Чтение пакетов: бинарный формат против NDJSON и CSV.
+
+Запуск: python -m benchmarks.bench_packed [count]
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+
+from batch import compute_batch
+from benchmarks.common import best_of, synthetic_packages
+from packed import PackedReader, write_packed_file
+from streaming import iter_packages
+
+
+def read_text(path: str, fmt: str) -> int:
+    with open(path, encoding='utf-8', newline='') as source:
+        return sum(1 for _ in iter_packages(source, fmt))
+
+
+def read_packed(path: str) -> int:
+    with PackedReader(path) as reader:
+        return sum(1 for _ in reader)
+
+
+def compute_packed(path: str) -> int:
+    with PackedReader(path) as reader:
+        columns = reader.columns()
+        result = compute_batch(reader.workout_types(), columns)
+        for column in columns:
+            column.release()
+    return len(result['calories'])
+
+
+def main(count: int = 200_000) -> None:
+    packages = synthetic_packages(count)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {fmt: os.path.join(directory, f'packages.{fmt}')
+                 for fmt in ('ndjson', 'csv', 'bin')}
+        with open(paths['ndjson'], 'w', encoding='utf-8') as out:
+            out.writelines(json.dumps(package) + '\n'
+                           for package in packages)
+        with open(paths['csv'], 'w', encoding='utf-8', newline='') as out:
+            csv.writer(out).writerows([workout_type, *data]
+                                      for workout_type, data in packages)
+        write_packed_file(paths['bin'], packages)
+        cases = [
+            ('NDJSON', 'ndjson',
+             lambda: read_text(paths['ndjson'], 'ndjson')),
+            ('CSV', 'csv', lambda: read_text(paths['csv'], 'csv')),
+            ('packed, пакеты', 'bin', lambda: read_packed(paths['bin'])),
+            ('packed + compute_batch', 'bin',
+             lambda: compute_packed(paths['bin'])),
+        ]
+        for name, fmt, case in cases:
+            seconds: float = best_of(case)
+            size: int = os.path.getsize(paths[fmt])
+            print(f'{name:<24}{seconds:8.3f} с{count / seconds:14,.0f} '
+                  f'записей/с{size / 2 ** 20:8.1f} МиБ')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
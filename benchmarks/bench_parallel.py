@@ -0,0 +1,28 @@
+"""Масштабирование `run_parallel` по числу процессов.
+
+Запуск: python -m benchmarks.bench_parallel [count] [chunk_size]
+"""
+import os
+import sys
+
+from benchmarks.common import best_of, synthetic_packages
+from parallel import DEFAULT_CHUNK_SIZE, process_chunk, run_parallel
+
+
+def main(count: int = 1_000_000,
+         chunk_size: int = DEFAULT_CHUNK_SIZE,
+         ) -> None:
+    packages = synthetic_packages(count)
+    sequential: float = best_of(lambda: process_chunk(packages), repeat=1)
+    print(f'{"1 ядро, без пула":<18}{sequential:8.3f} с')
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        seconds: float = best_of(
+            lambda: list(run_parallel(packages, workers, chunk_size)),
+            repeat=1,
+        )
+        print(f'{workers:>3} проц.{"":<9}{seconds:8.3f} с'
+              f'{sequential / seconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Конвейер потоков против последовательного цикла из `__main__`.
+
+Запуск: python -m benchmarks.bench_pipeline [count]
+"""
+import contextlib
+import os
+import sys
+import tempfile
+from typing import List, Tuple
+
+from benchmarks.common import best_of, synthetic_packages
+from homework import main as print_training, read_package
+from pipeline import Pipeline
+from streaming import iter_packages
+
+SETTINGS: List[Tuple[int, int, int]] = [
+    (1, 1, 1000),
+    (1, 1, 10000),
+    (2, 1, 5000),
+    (2, 2, 5000),
+]
+
+
+def sequential(source_path: str, target_path: str) -> None:
+    """Цикл `__main__`: пакет за пакетом, `print` на каждую тренировку."""
+    with open(source_path, encoding='utf-8', newline='') as source, \
+            open(target_path, 'w', encoding='utf-8') as target, \
+            contextlib.redirect_stdout(target):
+        for workout_type, data in iter_packages(source, 'csv'):
+            print_training(read_package(workout_type, data))
+
+
+def threaded(source_path: str, target_path: str,
+             settings: Tuple[int, int, int]) -> None:
+    parsers, computers, chunk_size = settings
+    with open(source_path, encoding='utf-8', newline='') as source, \
+            open(target_path, 'w', encoding='utf-8') as target:
+        Pipeline(parsers, computers, chunk_size, fmt='csv').run(source,
+                                                                target)
+
+
+def main(count: int = 300_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        source_path: str = os.path.join(directory, 'packages.csv')
+        target_path: str = os.path.join(directory, 'report.txt')
+        with open(source_path, 'w', encoding='utf-8') as out:
+            for workout_type, data in synthetic_packages(count):
+                out.write(f'{workout_type},{",".join(map(str, data))}\n')
+        base: float = best_of(lambda: sequential(source_path, target_path))
+        print(f'{"последовательно":<34}{base:8.3f} с')
+        for settings in SETTINGS:
+            seconds: float = best_of(
+                lambda: threaded(source_path, target_path, settings)
+            )
+            label: str = 'разбор {}, расчёт {}, пачка {}'.format(*settings)
+            print(f'{label:<34}{seconds:8.3f} с{base / seconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
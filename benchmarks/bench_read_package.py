@@ -0,0 +1,32 @@
+"""Скорость `read_package`: прежняя реализация против реестра.
+
+Запуск: python -m benchmarks.bench_read_package [count]
+"""
+import sys
+from typing import Dict, Type
+
+from benchmarks.common import best_of, synthetic_packages
+from homework import Running, SportsWalking, Swimming, Training, read_package
+
+
+def legacy_read_package(workout_type: str, data: list) -> Training:
+    """Прежняя реализация: словарь на каждый вызов и полный `__init__`."""
+    workout_type_dict: Dict[str, Type[Training]] = {'RUN': Running,
+                                                    'WLK': SportsWalking,
+                                                    'SWM': Swimming,
+                                                    }
+    if workout_type not in workout_type_dict:
+        raise ValueError
+    return workout_type_dict[workout_type](*data)
+
+
+def main(count: int = 300_000) -> None:
+    packages = synthetic_packages(count)
+    for name, reader in (('прежняя', legacy_read_package),
+                         ('реестр', read_package)):
+        seconds: float = best_of(lambda: [reader(*p) for p in packages])
+        print(f'{name:<10}{count / seconds:14,.0f} вызовов/с')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
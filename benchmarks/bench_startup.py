@@ -0,0 +1,74 @@
+"""Время запуска `quick.py` против `streaming.py`.
+
+Запуск: python -m benchmarks.bench_startup [runs]
+
+Печатает суммарное время импортов по `python -X importtime` и среднее
+время выполнения одного вызова: потоковый CLI, `quick.py` с расчётом
+в процессе и `quick.py` с запущенным постоянным процессом.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE: str = 'RUN,15000,1,75\n'
+
+
+def import_time(command: List[str], env: Dict[str, str]) -> float:
+    """Суммарное время импортов верхнего уровня, в миллисекундах."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *command],
+                            input=PACKAGE, capture_output=True, text=True,
+                            cwd=ROOT, env=env)
+    total: int = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit() and not name.startswith('   '):
+            total += int(cumulative)
+    return total / 1000
+
+
+def wall_time(command: List[str], env: Dict[str, str], runs: int) -> float:
+    """Среднее время одного вызова, в миллисекундах."""
+    started: float = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run([sys.executable, *command], input=PACKAGE,
+                       capture_output=True, text=True, cwd=ROOT, env=env,
+                       check=True)
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main(runs: int = 20) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path: str = os.path.join(directory, 'worker.sock')
+        env: Dict[str, str] = dict(os.environ,
+                                   TRAINING_WORKER_SOCKET=socket_path)
+        cases = [
+            ('streaming.py', ['streaming.py', '--format', 'csv'], False),
+            ('quick.py, в процессе', ['quick.py', '--local'], False),
+            ('quick.py + worker', ['quick.py'], True),
+        ]
+        worker: Optional[subprocess.Popen] = None
+        try:
+            for name, command, needs_worker in cases:
+                if needs_worker and worker is None:
+                    worker = subprocess.Popen(
+                        [sys.executable, 'quick.py', '--serve', socket_path],
+                        cwd=ROOT, env=env,
+                    )
+                    while not os.path.exists(socket_path):
+                        time.sleep(0.05)
+                print(f'{name:<24}импорты {import_time(command, env):7.1f} мс'
+                      f'   вызов {wall_time(command, env, runs):7.1f} мс')
+        finally:
+            if worker is not None:
+                worker.terminate()
+                worker.wait()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""Пропускная способность записи и запросов `ResultStore`.
+
+Запуск: python -m benchmarks.bench_store [count] [path]
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Iterator
+
+from benchmarks.common import synthetic_packages
+from homework import read_package
+from store import WEEK, ResultStore, Row, to_row
+
+ATHLETES: int = 10_000
+START: float = 1_600_000_000.0
+STEP: float = 30.0
+
+
+def result_rows(count: int, pool_size: int = 10_000) -> Iterator[Row]:
+    """Строки результатов с равномерно растущим временем."""
+    infos = [read_package(*package).show_training_info()
+             for package in synthetic_packages(pool_size)]
+    for index in range(count):
+        yield to_row(f'athlete-{index % ATHLETES}', START + index * STEP,
+                     infos[index % pool_size])
+
+
+def main(count: int = 10_000_000, path: str = '') -> None:
+    directory = None
+    if not path:
+        directory = tempfile.TemporaryDirectory()
+        path = os.path.join(directory.name, 'results.sqlite')
+    try:
+        with ResultStore(path, batch_size=50_000) as result_store:
+            started: float = time.perf_counter()
+            result_store.insert_rows(result_rows(count))
+            seconds: float = time.perf_counter() - started
+            print(f'запись {count:,} строк за {seconds:.1f} с: '
+                  f'{count / seconds:,.0f} строк/с, '
+                  f'{os.path.getsize(path) / 2 ** 20:,.0f} МиБ')
+            end: float = START + count * STEP
+            for title, query in (
+                ('Swimming за неделю',
+                 lambda: result_store.last_week('Swimming', now=end)),
+                ('спортсмен за неделю',
+                 lambda: result_store.last_week(athlete='athlete-1',
+                                                now=end)),
+                ('все за сутки',
+                 lambda: result_store.query(start=end - WEEK / 7, end=end)),
+            ):
+                started = time.perf_counter()
+                found: int = sum(1 for _ in query())
+                seconds = time.perf_counter() - started
+                print(f'{title}: {found:,} строк за {seconds * 1000:.1f} мс')
+    finally:
+        if directory is not None:
+            directory.cleanup()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) if arg.isdigit() else arg for arg in sys.argv[1:]))
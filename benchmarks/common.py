@@ -0,0 +1,36 @@
+"""Общие помощники бенчмарков."""
+import random
+import time
+from typing import Callable, List, Tuple
+
+Package = Tuple[str, List[float]]
+
+
+def synthetic_packages(count: int, seed: int = 0) -> List[Package]:
+    """Сгенерировать `count` правдоподобных пакетов всех типов."""
+    rng = random.Random(seed)
+    packages: List[Package] = []
+    for _ in range(count):
+        workout_type: str = rng.choice(('RUN', 'WLK', 'SWM'))
+        action: int = rng.randint(500, 30000)
+        duration: float = round(rng.uniform(0.2, 3.0), 2)
+        weight: float = rng.randint(45, 120)
+        if workout_type == 'RUN':
+            data: List[float] = [action, duration, weight]
+        elif workout_type == 'WLK':
+            data = [action, duration, weight, rng.randint(150, 200)]
+        else:
+            data = [action, duration, weight, rng.choice((25, 50)),
+                    rng.randint(10, 80)]
+        packages.append((workout_type, data))
+    return packages
+
+
+def best_of(function: Callable[[], object], repeat: int = 3) -> float:
+    """Лучшее время выполнения `function` за `repeat` запусков, в секундах."""
+    best: float = float('inf')
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
@@ -0,0 +1,80 @@
+"""Нагрузочный генератор для `server.py`: пропускная способность и p99.
+
+Запуск: python -m benchmarks.load_server [clients] [packages_per_client]
+Без `--connect` сервер поднимается в том же процессе на Unix-сокете.
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from typing import Deque, List
+
+from benchmarks.common import synthetic_packages
+from server import TrainingServer
+
+
+async def run_client(path: str, count: int, seed: int,
+                     latencies: List[float]) -> None:
+    """Отправить `count` пакетов и замерить задержку каждого ответа."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    sent: Deque[float] = deque()
+
+    async def send() -> None:
+        for package in synthetic_packages(count, seed):
+            sent.append(time.perf_counter())
+            writer.write(json.dumps(package).encode('utf-8') + b'\n')
+            await writer.drain()
+        writer.write_eof()
+
+    sender = asyncio.ensure_future(send())
+    async for _ in reader:
+        latencies.append(time.perf_counter() - sent.popleft())
+    await sender
+    writer.close()
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Значение перцентиля `share` (от 0 до 1)."""
+    ordered: List[float] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = TrainingServer(args.queue_size, args.batch_size)
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = args.connect or os.path.join(directory, 'server.sock')
+        listener = None
+        if not args.connect:
+            listener = await server.start_unix(path)
+        latencies: List[float] = []
+        started: float = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(path, args.packages, seed, latencies)
+            for seed in range(args.clients)
+        ))
+        elapsed: float = time.perf_counter() - started
+        if listener is not None:
+            listener.close()
+            await listener.wait_closed()
+        await server.close()
+    print(f'{len(latencies)} ответов за {elapsed:.3f} с, '
+          f'{len(latencies) / elapsed:,.0f} пакетов/с')
+    print(f'p50 {percentile(latencies, 0.50) * 1000:.2f} мс, '
+          f'p99 {percentile(latencies, 0.99) * 1000:.2f} мс')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('clients', nargs='?', type=int, default=16)
+    parser.add_argument('packages', nargs='?', type=int, default=5000)
+    parser.add_argument('--connect', help='Unix-сокет уже запущенного сервера')
+    parser.add_argument('--queue-size', type=int, default=1024)
+    parser.add_argument('--batch-size', type=int, default=256)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Набор замеров производительности с проверкой на регрессии.
+
+Запуск: python -m benchmarks.suite [--sizes 1e3,1e5] [--threshold 0.25]
+        [--update-baseline]
+
+Для каждого случая и размера набора считается пропускная способность
+(элементов в секунду, лучший из `--repeat` запусков) и пиковая память
+по `tracemalloc`. Результаты сравниваются с `baseline.json`; если
+пропускная способность упала или пиковая память выросла больше чем на
+`threshold`, команда завершается с кодом 1.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tracemalloc
+from itertools import cycle, islice
+from typing import Callable, Dict, List, Optional, Sequence
+
+from benchmarks.common import Package, best_of, synthetic_packages
+from homework import main, read_package
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(__file__),
+                                  'baseline.json')
+DEFAULT_SIZES: Sequence[int] = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD: float = 0.25
+POOL_SIZE: int = 10_000
+
+Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+def package_pool(count: int) -> List[Package]:
+    """Пул пакетов, по кругу повторяемый до `count` элементов."""
+    return synthetic_packages(min(count, POOL_SIZE))
+
+
+def run_read_package(pool: List[Package], count: int) -> None:
+    for workout_type, data in islice(cycle(pool), count):
+        read_package(workout_type, data)
+
+
+def run_show_training_info(pool: List[Package], count: int) -> None:
+    trainings = [read_package(*package) for package in pool]
+    for training in islice(cycle(trainings), count):
+        training.show_training_info()
+
+
+def run_get_message(pool: List[Package], count: int) -> None:
+    infos = [read_package(*package).show_training_info()
+             for package in pool]
+    for info in islice(cycle(infos), count):
+        info.get_message()
+
+
+def run_main(pool: List[Package], count: int) -> None:
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            for workout_type, data in islice(cycle(pool), count):
+                main(read_package(workout_type, data))
+
+
+CASES: Dict[str, Callable[[List[Package], int], None]] = {
+    'read_package': run_read_package,
+    'show_training_info': run_show_training_info,
+    'get_message': run_get_message,
+    'main': run_main,
+}
+
+
+def peak_memory(case: Callable[[List[Package], int], None],
+                pool: List[Package], count: int) -> int:
+    """Пиковая память, выделенная во время выполнения случая."""
+    tracemalloc.start()
+    try:
+        case(pool, count)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(sizes: Sequence[int], repeat: int, memory: bool = True,
+            ) -> Results:
+    """Выполнить все случаи для всех размеров."""
+    results: Results = {}
+    pools: Dict[int, List[Package]] = {size: package_pool(size)
+                                       for size in sizes}
+    for name, case in CASES.items():
+        for size in sizes:
+            pool: List[Package] = pools[size]
+            seconds: float = best_of(lambda: case(pool, size), repeat)
+            entry: Dict[str, float] = {'throughput': size / seconds}
+            if memory:
+                entry['peak_bytes'] = peak_memory(case, pool, size)
+            results.setdefault(name, {})[str(size)] = entry
+    return results
+
+
+def compare(results: Results, baseline: Results,
+            threshold: float) -> List[str]:
+    """Список регрессий относительно базовых результатов."""
+    regressions: List[str] = []
+    for name, sizes in results.items():
+        for size, entry in sizes.items():
+            base: Optional[Dict[str, float]] = baseline.get(
+                name, {}).get(size)
+            if base is None:
+                continue
+            slowest: float = base['throughput'] * (1 - threshold)
+            if entry['throughput'] < slowest:
+                regressions.append(
+                    f'{name}[{size}]: {entry["throughput"]:,.0f}/с '
+                    f'< {slowest:,.0f}/с'
+                )
+            if 'peak_bytes' in entry and 'peak_bytes' in base:
+                largest: float = base['peak_bytes'] * (1 + threshold)
+                if entry['peak_bytes'] > largest:
+                    regressions.append(
+                        f'{name}[{size}]: пик памяти '
+                        f'{entry["peak_bytes"]:,.0f} Б > {largest:,.0f} Б'
+                    )
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Results:
+    """Прочитать базовые результаты, если они есть."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as source:
+        return json.load(source)
+
+
+def save_baseline(results: Results, path: str = BASELINE_PATH) -> None:
+    """Сохранить результаты как новые базовые, дополнив старые."""
+    merged: Results = load_baseline(path)
+    for name, sizes in results.items():
+        merged.setdefault(name, {}).update(sizes)
+    with open(path, 'w', encoding='utf-8') as out:
+        json.dump(merged, out, indent=2, sort_keys=True)
+        out.write('\n')
+
+
+def parse_sizes(text: str) -> List[int]:
+    """Разобрать список размеров вида `1e3,1e5,20000`."""
+    return [int(float(item)) for item in text.split(',') if item]
+
+
+def run(argv: Optional[Sequence[str]] = None) -> int:
+    """Выполнить замеры и вернуть код завершения."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes,
+                        default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float,
+                        default=DEFAULT_THRESHOLD)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--no-memory', action='store_true')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+    results: Results = measure(args.sizes, args.repeat,
+                               memory=not args.no_memory)
+    for name, sizes in results.items():
+        for size, entry in sizes.items():
+            peak: str = (f'{entry["peak_bytes"] / 2 ** 20:10.2f} МиБ'
+                         if 'peak_bytes' in entry else '')
+            print(f'{name:<20}{size:>10}{entry["throughput"]:14,.0f}/с'
+                  f'{peak}')
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        return 0
+    regressions: List[str] = compare(results, load_baseline(args.baseline),
+                                     args.threshold)
+    for regression in regressions:
+        print(f'РЕГРЕССИЯ {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
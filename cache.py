@@ -0,0 +1,129 @@
+"""Кеширование результатов для повторяющихся пакетов."""
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Type
+
+from homework import WORKOUT_TYPES, InfoMessage, Training
+
+DEFAULT_MAXSIZE: int = 100_000
+
+CacheKey = Tuple[str, Tuple[float, ...]]
+
+
+class LRUCache:
+    """Словарь ограниченного размера с вытеснением давно не читанных."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize должен быть положительным')
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._data: 'OrderedDict[Hashable, object]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Вернуть значение по ключу или `None`, учитывая попадание."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Сохранить значение, при переполнении вытеснив самое старое."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Очистить кеш, не сбрасывая счётчики."""
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики попаданий, промахов и вытеснений."""
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                }
+
+
+class MetricsCacheMixin:
+    """Запоминает дистанцию и среднюю скорость при первом расчёте.
+
+    `show_training_info` и `Running.get_spent_calories` вызывают эти
+    методы повторно; с примесью каждый считается один раз на объект.
+    Данные тренировки после первого расчёта менять не следует.
+    """
+
+    def get_distance(self) -> float:
+        try:
+            return self._cached_distance
+        except AttributeError:
+            self._cached_distance: float = super().get_distance()
+            return self._cached_distance
+
+    def get_mean_speed(self) -> float:
+        try:
+            return self._cached_mean_speed
+        except AttributeError:
+            self._cached_mean_speed: float = super().get_mean_speed()
+            return self._cached_mean_speed
+
+
+def cached_metrics(cls: Type[Training]) -> Type[Training]:
+    """Построить подкласс `cls` с ленивым кешированием метрик."""
+    return type(cls.__name__, (MetricsCacheMixin, cls),
+                {'__qualname__': cls.__qualname__})
+
+
+CACHED_CLASSES: Dict[str, Type[Training]] = {
+    workout_type: cached_metrics(cls)
+    for workout_type, cls in WORKOUT_TYPES.items()
+}
+
+
+def read_cached_package(workout_type: str, data: Sequence[float],
+                        ) -> Training:
+    """Прочитать пакет в класс тренировки с кешированием метрик."""
+    if workout_type not in CACHED_CLASSES:
+        raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+    return CACHED_CLASSES[workout_type](*data)
+
+
+class CachedCalculator:
+    """Расчёт пакетов с кешем готовых `InfoMessage`.
+
+    Возвращаемые сообщения общие для одинаковых пакетов, изменять
+    их нельзя.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.cache: LRUCache = LRUCache(maxsize)
+
+    def info(self, workout_type: str, data: Sequence[float]) -> InfoMessage:
+        """Информационное сообщение о тренировке по пакету."""
+        key: CacheKey = (workout_type, tuple(data))
+        info = self.cache.get(key)
+        if info is None:
+            info = read_cached_package(workout_type,
+                                       data).show_training_info()
+            self.cache.put(key, info)
+        return info
+
+    def message(self, workout_type: str, data: Sequence[float]) -> str:
+        """Строка отчёта о тренировке по пакету."""
+        return self.info(workout_type, data).get_message()
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики кеша."""
+        return self.cache.stats()
@@ -0,0 +1,225 @@
+"""Удаление повторов и восстановление порядка пакетов с устройств."""
+import heapq
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Sequence, Tuple
+
+DEFAULT_CAPACITY: int = 1_000_000
+DEFAULT_ERROR_RATE: float = 0.001
+DEFAULT_EXACT_SIZE: int = 100_000
+DEFAULT_WINDOW: float = 5.0
+
+DevicePackage = Tuple[Hashable, int, float, str, Sequence[float]]
+
+
+class BloomFilter:
+    """Фильтр Блума на `bytearray` с двойным хешированием.
+
+    Хеши берутся от встроенной `hash()`, поэтому фильтр годится только
+    внутри одного процесса.
+    """
+
+    __slots__ = ('size', 'hashes', 'bits', 'count')
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE) -> None:
+        self.size: int = max(8, int(-capacity * math.log(error_rate)
+                                    / math.log(2) ** 2))
+        self.hashes: int = max(1, round(self.size / capacity
+                                        * math.log(2)))
+        self.bits: bytearray = bytearray((self.size + 7) // 8)
+        self.count: int = 0
+
+    def positions(self, key: Hashable) -> Iterator[int]:
+        """Номера битов ключа; у фильтров одного размера они совпадают."""
+        hashed: int = hash(key)
+        first: int = hashed & 0xFFFFFFFF
+        second: int = (hashed >> 32) | 1
+        size: int = self.size
+        for position in range(first, first + self.hashes * second, second):
+            yield position % size
+
+    def add(self, key: Hashable) -> bool:
+        """Добавить ключ; `True`, если он, возможно, уже был."""
+        bits = self.bits
+        present: bool = True
+        for position in self.positions(key):
+            mask: int = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                present = False
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, key: Hashable) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7))
+                   for position in self.positions(key))
+
+
+class Deduplicator:
+    """Ограниченный по памяти индекс уже виденных ключей.
+
+    Недавние ключи хранятся точно в LRU-множестве из `exact_size`
+    элементов. Более старые помнит пара поколений фильтра Блума: когда
+    текущее поколение заполняется до `capacity` ключей, оно становится
+    предыдущим, а самое старое выбрасывается. Повторы, найденные только
+    фильтром, учитываются ещё и в `uncertain`: среди них с вероятностью
+    около `error_rate` встречаются новые ключи.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE,
+                 exact_size: int = DEFAULT_EXACT_SIZE) -> None:
+        self.capacity: int = capacity
+        self.error_rate: float = error_rate
+        self.exact_size: int = exact_size
+        self.current: BloomFilter = BloomFilter(capacity, error_rate)
+        self.previous: BloomFilter = BloomFilter(capacity, error_rate)
+        self.exact: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self.unique: int = 0
+        self.duplicates: int = 0
+        self.uncertain: int = 0
+
+    def seen(self, key: Hashable) -> bool:
+        """Отметить ключ; `True`, если это повтор."""
+        exact = self.exact
+        if key in exact:
+            exact.move_to_end(key)
+            self.duplicates += 1
+            return True
+        current: BloomFilter = self.current
+        if current.count >= self.capacity:
+            self.previous = current
+            current = self.current = BloomFilter(self.capacity,
+                                                 self.error_rate)
+        # Тот же обход, что в `BloomFilter.add`, но за один проход
+        # проверяет и предыдущее поколение: это горячий путь.
+        hashed: int = hash(key)
+        first: int = hashed & 0xFFFFFFFF
+        second: int = (hashed >> 32) | 1
+        size: int = current.size
+        bits: bytearray = current.bits
+        old_bits: bytearray = self.previous.bits
+        in_current: bool = True
+        in_previous: bool = True
+        for position in range(first, first + current.hashes * second,
+                              second):
+            position %= size
+            byte: int = position >> 3
+            mask: int = 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                in_current = False
+            if in_previous and not old_bits[byte] & mask:
+                in_previous = False
+        if not in_current:
+            current.count += 1
+        if in_current or in_previous:
+            self.duplicates += 1
+            self.uncertain += 1
+            return True
+        self.unique += 1
+        exact[key] = None
+        if len(exact) > self.exact_size:
+            exact.popitem(last=False)
+        return False
+
+
+class ReorderBuffer:
+    """Буфер, выпускающий элементы по возрастанию времени.
+
+    Элемент отдаётся, когда самое позднее увиденное время ушло от него
+    дальше чем на `window` секунд. Элементы, пришедшие позже уже
+    выпущенных, отдаются сразу и учитываются в `late`.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW) -> None:
+        self.window: float = window
+        self.watermark: float = -math.inf
+        self.latest: float = -math.inf
+        self.reordered: int = 0
+        self.late: int = 0
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter: int = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, timestamp: float, item: Any) -> List[Any]:
+        """Добавить элемент и вернуть те, что пора выпустить."""
+        if timestamp < self.watermark:
+            self.late += 1
+            return [item]
+        if timestamp < self.latest:
+            self.reordered += 1
+        else:
+            self.latest = timestamp
+        heapq.heappush(self._heap, (timestamp, self._counter, item))
+        self._counter += 1
+        return self._release(self.latest - self.window)
+
+    def _release(self, border: float) -> List[Any]:
+        released: List[Any] = []
+        heap = self._heap
+        while heap and heap[0][0] <= border:
+            timestamp, _, item = heapq.heappop(heap)
+            self.watermark = timestamp
+            released.append(item)
+        return released
+
+    def flush(self) -> List[Any]:
+        """Выпустить всё, что осталось в буфере."""
+        return self._release(math.inf)
+
+
+class StreamIngestor:
+    """Удаление повторов и упорядочивание перед расчётом тренировок.
+
+    Пакет описывается кортежем `(device, seq, timestamp, workout_type,
+    data)`; повтором считается пакет с уже виденной парой
+    `(device, seq)`. Выпущенные пакеты `(workout_type, data)` готовы
+    для `read_package`.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW,
+                 capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE,
+                 exact_size: int = DEFAULT_EXACT_SIZE) -> None:
+        self.dedup: Deduplicator = Deduplicator(capacity, error_rate,
+                                                exact_size)
+        self.reorder: ReorderBuffer = ReorderBuffer(window)
+        self.received: int = 0
+
+    def push(self, device: Hashable, seq: int, timestamp: float,
+             workout_type: str, data: Sequence[float],
+             ) -> List[Tuple[str, Sequence[float]]]:
+        """Принять пакет и вернуть пакеты, готовые к расчёту."""
+        self.received += 1
+        if self.dedup.seen((device, seq)):
+            return []
+        return self.reorder.push(timestamp, (workout_type, data))
+
+    def push_many(self, packages: Sequence[DevicePackage],
+                  ) -> List[Tuple[str, Sequence[float]]]:
+        """Принять несколько пакетов."""
+        released: List[Tuple[str, Sequence[float]]] = []
+        for package in packages:
+            released.extend(self.push(*package))
+        return released
+
+    def flush(self) -> List[Tuple[str, Sequence[float]]]:
+        """Выпустить всё, что ждёт в буфере упорядочивания."""
+        return self.reorder.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики повторов и перестановок."""
+        return {'received': self.received,
+                'unique': self.dedup.unique,
+                'duplicates': self.dedup.duplicates,
+                'uncertain': self.dedup.uncertain,
+                'reordered': self.reorder.reordered,
+                'late': self.reorder.late,
+                'buffered': len(self.reorder),
+                }
@@ -0,0 +1,65 @@
+"""Быстрое форматирование отчётов о тренировках."""
+import io
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from homework import InfoMessage, compile_message
+
+DEFAULT_BUFFER_SIZE: int = 64 * 1024
+
+
+def format_message(info: InfoMessage) -> str:
+    """Строка отчёта, совпадающая с `InfoMessage.get_message`."""
+    template, get_fields = compile_message(info.INFO_MESSAGE)
+    return template.format(*get_fields(info))
+
+
+def _make_writer(out: Any, encoding: str) -> Callable[[str], Any]:
+    """Подобрать способ записи строки в файл, поток или сокет."""
+    if hasattr(out, 'sendall'):
+        return lambda text: out.sendall(text.encode(encoding))
+    binary: bool = (isinstance(out, (io.RawIOBase, io.BufferedIOBase))
+                    or 'b' in getattr(out, 'mode', ''))
+    if not binary:
+        return out.write
+    return lambda text: out.write(text.encode(encoding))
+
+
+def format_messages(messages: Iterable[InfoMessage],
+                    out: Optional[IO] = None,
+                    buffer_size: int = DEFAULT_BUFFER_SIZE,
+                    encoding: str = 'utf-8',
+                    ) -> Optional[str]:
+    """Отформатировать много сообщений, по строке на каждое.
+
+    Без `out` возвращает весь текст одной строкой. Иначе текст пишется
+    в `out` блоками примерно по `buffer_size` символов: подходят
+    текстовые и бинарные файлы, а также сокеты (`sendall`).
+    """
+    write: Callable[[str], Any]
+    collected: List[str] = []
+    if out is None:
+        write = collected.append
+    else:
+        write = _make_writer(out, encoding)
+    compiled: Dict[str, Tuple[str, Callable]] = {}
+    chunk: List[str] = []
+    chunk_size: int = 0
+    for info in messages:
+        template_key: str = info.INFO_MESSAGE
+        if template_key not in compiled:
+            compiled[template_key] = compile_message(template_key)
+        template, get_fields = compiled[template_key]
+        line: str = template.format(*get_fields(info))
+        chunk.append(line)
+        chunk_size += len(line) + 1
+        if chunk_size >= buffer_size:
+            chunk.append('')
+            write('\n'.join(chunk))
+            chunk.clear()
+            chunk_size = 0
+    if chunk:
+        chunk.append('')
+        write('\n'.join(chunk))
+    if out is None:
+        return ''.join(collected)
+    return None
@@ -1,5 +1,32 @@
-from typing import Dict, Type
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple, Type
+from dataclasses import dataclass
+from inspect import signature
+from functools import lru_cache
+from operator import attrgetter
+from string import Formatter
+
+
+@lru_cache(maxsize=None)
+def compile_message(template: str) -> Tuple[str, Callable]:
+    """Превратить шаблон с именованными полями в позиционный.
+
+    Возвращает позиционный шаблон и функцию, достающую значения полей
+    из объекта в нужном порядке.
+    """
+    parts: List[str] = []
+    names: List[str] = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if name is not None:
+            parts.append('{' + str(len(names))
+                         + ('!' + conversion if conversion else '')
+                         + (':' + spec if spec else '')
+                         + '}')
+            names.append(name)
+    get_fields: Callable = attrgetter(*names)
+    if len(names) == 1:
+        return ''.join(parts), lambda obj: (get_fields(obj),)
+    return ''.join(parts), get_fields
 
 
 @dataclass
@@ -17,9 +44,9 @@ class InfoMessage:
     speed: float
     calories: float
 
-    def get_message(self) -> None:
-        info_about_training = asdict(self)
-        return (self.INFO_MESSAGE.format(**info_about_training))
+    def get_message(self) -> str:
+        template, get_fields = compile_message(self.INFO_MESSAGE)
+        return template.format(*get_fields(self))
 
 
 class Training:
@@ -63,6 +90,33 @@ class Training:
         return info_message
 
 
+WORKOUT_TYPES: Dict[str, Type[Training]] = {}
+WORKOUT_FACTORIES: Dict[str, Callable[..., Training]] = {}
+WORKOUT_FIELDS: Dict[str, Tuple[str, ...]] = {}
+
+
+def init_fields(cls: Type[Training]) -> Tuple[str, ...]:
+    """Имена параметров `__init__` класса тренировки по порядку."""
+    return tuple(signature(cls.__init__).parameters)[1:]
+
+
+def register_workout(workout_type: str,
+                     factory: Optional[Callable[..., Training]] = None,
+                     ) -> Callable[[Type[Training]], Type[Training]]:
+    """Зарегистрировать класс тренировки под кодом из пакета.
+
+    Если `factory` не передана, объекты создаёт сам класс с полным
+    `__init__`.
+    """
+    def decorator(cls: Type[Training]) -> Type[Training]:
+        WORKOUT_TYPES[workout_type] = cls
+        WORKOUT_FIELDS[workout_type] = init_fields(cls)
+        WORKOUT_FACTORIES[workout_type] = factory or cls
+        return cls
+    return decorator
+
+
+@register_workout('RUN')
 class Running(Training):
     """Тренировка: бег."""
     CAL_MULTIPLIER: float = 18
@@ -82,6 +136,7 @@ class Running(Training):
         return spent_calories
 
 
+@register_workout('WLK')
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
     WEIGHT_MULTIPLIER_1: float = 0.035
@@ -111,6 +166,7 @@ class SportsWalking(Training):
         return spent_calories
 
 
+@register_workout('SWM')
 class Swimming(Training):
     """Тренировка: плавание."""
     LEN_STEP: float = 1.38
@@ -149,15 +205,13 @@ class Swimming(Training):
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    workout_type_dict: Dict[str, Type[Training]] = {'RUN': Running,
-                                                    'WLK': SportsWalking,
-                                                    'SWM': Swimming,
-                                                    }
-    if workout_type not in workout_type_dict:
-        raise ValueError
-    else:
-        class_object: Training = workout_type_dict[workout_type](*data)
-        return class_object
+    try:
+        factory: Callable[..., Training] = WORKOUT_FACTORIES[workout_type]
+    except KeyError:
+        raise ValueError(f'Неизвестный код тренировки: {workout_type!r}; '
+                         f'ожидается один из: '
+                         f'{", ".join(WORKOUT_FACTORIES)}') from None
+    return factory(*data)
 
 
 def main(training: Training) -> None:
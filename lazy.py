@@ -0,0 +1,69 @@
+"""Ленивые сообщения о тренировке."""
+from typing import Any
+
+from homework import InfoMessage, Training, compile_message
+
+_UNSET: Any = object()
+
+
+class LazyInfoMessage:
+    """Сообщение с полями `InfoMessage`, считаемыми по первому обращению.
+
+    Дистанция, скорость и калории вычисляются методами тренировки
+    только когда их запрашивают, и затем запоминаются. Данные
+    тренировки после создания сообщения менять не следует.
+    """
+
+    __slots__ = ('training', '_distance', '_speed', '_calories')
+
+    INFO_MESSAGE: str = InfoMessage.INFO_MESSAGE
+
+    def __init__(self, training: Training) -> None:
+        self.training: Training = training
+        self._distance: Any = _UNSET
+        self._speed: Any = _UNSET
+        self._calories: Any = _UNSET
+
+    @property
+    def training_type(self) -> str:
+        return type(self.training).__name__
+
+    @property
+    def duration(self) -> float:
+        return self.training.duration
+
+    @property
+    def distance(self) -> float:
+        if self._distance is _UNSET:
+            self._distance = self.training.get_distance()
+        return self._distance
+
+    @property
+    def speed(self) -> float:
+        if self._speed is _UNSET:
+            self._speed = self.training.get_mean_speed()
+        return self._speed
+
+    @property
+    def calories(self) -> float:
+        if self._calories is _UNSET:
+            self._calories = self.training.get_spent_calories()
+        return self._calories
+
+    def get_message(self) -> str:
+        template, get_fields = compile_message(self.INFO_MESSAGE)
+        return template.format(*get_fields(self))
+
+    def to_info(self) -> InfoMessage:
+        """Обычный `InfoMessage` со всеми посчитанными полями."""
+        return InfoMessage(training_type=self.training_type,
+                           duration=self.duration,
+                           distance=self.distance,
+                           speed=self.speed,
+                           calories=self.calories,
+                           )
+
+
+def lazy_training_info(training: Training) -> LazyInfoMessage:
+    """Ленивый аналог `Training.show_training_info`."""
+    return LazyInfoMessage(training)
@@ -0,0 +1,150 @@
+"""Бинарный формат пакетов с чтением через mmap без копирования.
+
+Файл начинается с 8-байтового заголовка `MAGIC`, затем идут записи
+по `RECORD_SIZE` байт: код тренировки (ASCII, трёхбуквенные коды
+дополняются нулями до 8 байт ради выравнивания) и `WIDTH` чисел
+float64 в порядке little-endian. Поля, которых у тренировки нет,
+заполняются нулями. Колонки без копирования предполагают
+little-endian процессор.
+"""
+import mmap
+import struct
+from typing import IO, Any, Iterable, Iterator, List, Sequence, Tuple
+
+from homework import WORKOUT_FIELDS
+
+Package = Tuple[str, List[float]]
+
+MAGIC: bytes = b'TRPK\x01\x00\x00\x00'
+WIDTH: int = 5
+CODE_SIZE: int = 8
+RECORD: struct.Struct = struct.Struct(f'<{CODE_SIZE}s{WIDTH}d')
+RECORD_SIZE: int = RECORD.size
+DOUBLES_PER_RECORD: int = RECORD_SIZE // 8
+DEFAULT_CHUNK_SIZE: int = 4096
+
+
+def pack_package(workout_type: str, data: Sequence[float]) -> bytes:
+    """Упаковать один пакет в запись фиксированной длины.
+
+    Число значений проверяется, как при создании объекта в
+    `read_package`: неверный пакет вызывает `TypeError`.
+    """
+    if workout_type not in WORKOUT_FIELDS:
+        raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+    code: bytes = workout_type.encode('ascii')
+    if len(code) > CODE_SIZE:
+        raise ValueError(f'Код {workout_type!r} длиннее {CODE_SIZE} байт')
+    expected: int = len(WORKOUT_FIELDS[workout_type])
+    if len(data) != expected:
+        raise TypeError(f'Пакет {workout_type!r} должен содержать '
+                        f'{expected} значений, получено {len(data)}')
+    if len(data) > WIDTH:
+        raise ValueError(f'Пакет {workout_type!r} длиннее {WIDTH} полей')
+    values: List[float] = list(data) + [0.0] * (WIDTH - len(data))
+    return RECORD.pack(code, *values)
+
+
+def write_packed(out: IO[bytes], packages: Iterable[Package],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Записать пакеты в бинарный поток, вернуть число записей."""
+    out.write(MAGIC)
+    chunk: List[bytes] = []
+    written: int = 0
+    for workout_type, data in packages:
+        chunk.append(pack_package(workout_type, data))
+        if len(chunk) >= chunk_size:
+            out.write(b''.join(chunk))
+            written += len(chunk)
+            chunk.clear()
+    out.write(b''.join(chunk))
+    return written + len(chunk)
+
+
+def write_packed_file(path: str, packages: Iterable[Package]) -> int:
+    """Записать пакеты в файл `path`."""
+    with open(path, 'wb') as out:
+        return write_packed(out, packages)
+
+
+class PackedReader:
+    """Чтение бинарного файла пакетов через `mmap`.
+
+    `column()` и `columns()` возвращают срезы `memoryview` прямо над
+    отображённым файлом, без копирования данных. Перед `close()` их
+    нужно освободить (`release()`) или удалить.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f'Файл {path!r} пуст') from None
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f'Файл {path!r} не в формате пакетов')
+        body_size: int = len(self._mmap) - len(MAGIC)
+        if body_size % RECORD_SIZE:
+            self.close()
+            raise ValueError(f'Файл {path!r} обрезан')
+        self._body: memoryview = memoryview(self._mmap)[len(MAGIC):]
+        self._doubles: memoryview = self._body.cast('d')
+
+    def __enter__(self) -> 'PackedReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._body) // RECORD_SIZE
+
+    def close(self) -> None:
+        """Освободить отображение и закрыть файл."""
+        for name in ('_doubles', '_body'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def workout_type(self, index: int) -> str:
+        """Код тренировки записи `index`."""
+        offset: int = index * RECORD_SIZE
+        raw_code: bytes = bytes(self._body[offset:offset + CODE_SIZE])
+        return raw_code.rstrip(b'\0').decode('ascii')
+
+    def workout_types(self) -> List[str]:
+        """Коды тренировок всех записей."""
+        return [self.workout_type(index) for index in range(len(self))]
+
+    def column(self, position: int) -> memoryview:
+        """Поле `position` всех записей как срез `memoryview` без копии."""
+        if not 0 <= position < WIDTH:
+            raise IndexError(position)
+        return self._doubles[1 + position::DOUBLES_PER_RECORD]
+
+    def columns(self) -> List[memoryview]:
+        """Все поля в виде колонок для `batch.compute_batch`."""
+        return [self.column(position) for position in range(WIDTH)]
+
+    def __iter__(self) -> Iterator[Package]:
+        """Пакеты `(workout_type, data)` для `read_package`."""
+        fields = WORKOUT_FIELDS
+        for raw_code, *values in RECORD.iter_unpack(self._body):
+            workout_type: str = raw_code.rstrip(b'\0').decode('ascii')
+            yield workout_type, values[:len(fields[workout_type])]
+
+    def as_numpy(self) -> Any:
+        """Записи как структурированный массив NumPy без копирования.
+
+        NumPy не входит в зависимости проекта и импортируется только
+        при вызове этого метода.
+        """
+        import numpy
+        dtype = numpy.dtype([('workout_type', 'S8'),
+                             ('data', '<f8', (WIDTH,))])
+        return numpy.frombuffer(self._mmap, dtype=dtype, offset=len(MAGIC))
@@ -0,0 +1,75 @@
+"""Параллельная обработка больших наборов пакетов."""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (Deque, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple)
+
+from homework import InfoMessage, read_package
+
+Package = Tuple[str, Sequence[float]]
+CompactInfo = Tuple[str, float, float, float, float]
+
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+
+def process_chunk(packages: Sequence[Package]) -> List[CompactInfo]:
+    """Рассчитать пачку пакетов в процессе-исполнителе.
+
+    Возвращаются кортежи полей `InfoMessage`, а не объекты тренировок,
+    чтобы между процессами передавалось как можно меньше данных.
+    """
+    result: List[CompactInfo] = []
+    for workout_type, data in packages:
+        info: InfoMessage = read_package(workout_type,
+                                         data).show_training_info()
+        result.append((info.training_type, info.duration, info.distance,
+                       info.speed, info.calories))
+    return result
+
+
+def iter_chunks(packages: Iterable[Package],
+                chunk_size: int,
+                ) -> Iterator[List[Package]]:
+    """Разбить пакеты на списки по `chunk_size` штук."""
+    iterator: Iterator[Package] = iter(packages)
+    while True:
+        chunk: List[Package] = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_parallel(packages: Iterable[Package],
+                 workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 window: Optional[int] = None,
+                 ) -> Iterator[InfoMessage]:
+    """Рассчитать пакеты в `workers` процессах с сохранением порядка.
+
+    По умолчанию используется столько процессов, сколько ядер доступно.
+    В работе одновременно не больше `window` пачек (по умолчанию
+    `workers * 2`): следующая пачка читается из `packages`, только
+    когда отдана самая старая, поэтому ленивый вход не вычитывается
+    целиком. Если результаты перестали забирать, невыполненные пачки
+    отменяются.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size должен быть положительным')
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 2
+    chunks: Iterator[List[Package]] = iter_chunks(packages, chunk_size)
+    pending: Deque['Future[List[CompactInfo]]'] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for chunk in islice(chunks, window):
+            pending.append(executor.submit(process_chunk, chunk))
+        while pending:
+            result: List[CompactInfo] = pending.popleft().result()
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(process_chunk, chunk))
+            for fields in result:
+                yield InfoMessage(*fields)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
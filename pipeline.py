@@ -0,0 +1,163 @@
+"""Конвейер из потоков: чтение, разбор, расчёт и запись.
+
+Этапы связаны ограниченными очередями, поэтому медленный этап
+притормаживает предыдущие, а не копит данные в памяти. Чтение и
+запись файлов отпускают GIL и идут параллельно с расчётом; сами
+формулы считаются колоночными ядрами `batch`. С установленным NumPy
+ядра отпускают GIL на операциях над массивами; без него считают на
+чистом Python, и второй поток расчёта ничего не даёт.
+"""
+import threading
+from itertools import islice
+from queue import Queue
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional
+
+from batch import compute_batch, packages_to_columns
+from homework import WORKOUT_TYPES, InfoMessage, compile_message
+from streaming import Package, iter_packages
+
+DEFAULT_CHUNK_SIZE: int = 5000
+DEFAULT_QUEUE_SIZE: int = 8
+STOP: Any = object()
+
+
+def compute_chunk(packages: List[Package]) -> str:
+    """Рассчитать пачку пакетов и вернуть готовый текст отчёта.
+
+    Пакет с неверным числом полей вызывает `TypeError`, как в
+    `read_package`.
+    """
+    workout_types, columns = packages_to_columns(packages)
+    result = compute_batch(workout_types, columns)
+    template, _ = compile_message(InfoMessage.INFO_MESSAGE)
+    names: Dict[str, str] = {code: cls.__name__
+                             for code, cls in WORKOUT_TYPES.items()}
+    lines: List[str] = [
+        template.format(names[workout_type], duration, distance, speed,
+                        calories)
+        for workout_type, duration, distance, speed, calories in zip(
+            workout_types, columns[1], result['distance'],
+            result['speed'], result['calories'],
+        )
+    ]
+    lines.append('')
+    return '\n'.join(lines)
+
+
+class Pipeline:
+    """Многопоточный конвейер расчёта тренировок.
+
+    Настройки: `parsers` и `computers` — число потоков разбора и
+    расчёта, `chunk_size` — строк в одной пачке, `queue_size` — пачек
+    в каждой очереди между этапами.
+    """
+
+    def __init__(self, parsers: int = 1, computers: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 fmt: str = 'ndjson') -> None:
+        self.parsers: int = parsers
+        self.computers: int = computers
+        self.chunk_size: int = chunk_size
+        self.queue_size: int = queue_size
+        self.fmt: str = fmt
+        self._error: Optional[BaseException] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._running: Dict[str, int] = {}
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    def _read(self, lines: Iterable[str], outbox: 'Queue[Any]') -> None:
+        """Этап чтения: нарезать вход на пачки строк."""
+        iterator = iter(lines)
+        sequence: int = 0
+        try:
+            while self._error is None:
+                chunk: List[str] = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                outbox.put((sequence, chunk))
+                sequence += 1
+        except BaseException as error:
+            self._fail(error)
+        finally:
+            for _ in range(self.parsers):
+                outbox.put(STOP)
+
+    def _work(self, stage: str, function: Callable[[Any], Any],
+              inbox: 'Queue[Any]', outbox: 'Queue[Any]',
+              downstream: int) -> None:
+        """Этап обработки пачек; последний поток этапа передаёт STOP."""
+        while True:
+            item = inbox.get()
+            if item is STOP:
+                break
+            sequence, payload = item
+            result: Any = None
+            if self._error is None:
+                try:
+                    result = function(payload)
+                except BaseException as error:
+                    self._fail(error)
+            outbox.put((sequence, result))
+        with self._lock:
+            self._running[stage] -= 1
+            last: bool = self._running[stage] == 0
+        if last:
+            for _ in range(downstream):
+                outbox.put(STOP)
+
+    def _parse(self, lines: List[str]) -> List[Package]:
+        return list(iter_packages(lines, self.fmt))
+
+    def _write(self, inbox: 'Queue[Any]', out: IO[str]) -> None:
+        """Этап записи: выводить пачки строго по порядку."""
+        waiting: Dict[int, Optional[str]] = {}
+        expected: int = 0
+        while True:
+            item = inbox.get()
+            if item is STOP:
+                break
+            sequence, text = item
+            waiting[sequence] = text
+            while expected in waiting:
+                text = waiting.pop(expected)
+                expected += 1
+                if text is not None and self._error is None:
+                    try:
+                        out.write(text)
+                    except BaseException as error:
+                        self._fail(error)
+
+    def run(self, lines: Iterable[str], out: IO[str]) -> None:
+        """Обработать строки `lines` и записать отчёт в `out`."""
+        self._error = None
+        self._running = {'parse': self.parsers, 'compute': self.computers}
+        raw: 'Queue[Any]' = Queue(self.queue_size)
+        parsed: 'Queue[Any]' = Queue(self.queue_size)
+        computed: 'Queue[Any]' = Queue(self.queue_size)
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self._read, args=(lines, raw)),
+            threading.Thread(target=self._write, args=(computed, out)),
+        ]
+        threads += [
+            threading.Thread(target=self._work,
+                             args=('parse', self._parse, raw, parsed,
+                                   self.computers))
+            for _ in range(self.parsers)
+        ]
+        threads += [
+            threading.Thread(target=self._work,
+                             args=('compute', compute_chunk, parsed,
+                                   computed, 1))
+            for _ in range(self.computers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
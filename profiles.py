@@ -0,0 +1,141 @@
+"""Профили спортсменов с заранее посчитанными коэффициентами.
+
+Вес, рост и параметры бассейна у спортсмена постоянны, поэтому всё,
+что от них зависит и не меняет порядок операций в формулах классов,
+считается один раз при создании профиля. Перестановка множителей
+вроде `weight / M_IN_KM` изменила бы округление, поэтому такие части
+остаются в расчёте сеанса: результаты совпадают с методами классов
+бит в бит.
+"""
+import math
+from typing import Callable, ClassVar, Dict, Hashable, Optional
+
+from homework import InfoMessage, Running, SportsWalking, Swimming
+
+
+def _is_power_of_two(value: float) -> bool:
+    """Умножение на такое число не вносит ошибки округления."""
+    return value > 0 and math.frexp(value)[0] == 0.5
+
+
+class AthleteProfile:
+    """Постоянные параметры спортсмена и зависящие от них коэффициенты.
+
+    Расчёт сеанса принимает только `action` и `duration`.
+    """
+
+    __slots__ = ('weight', 'height', 'length_pool', 'count_pool',
+                 'walking_base', 'pool_km', 'swimming_weight')
+
+    def __init__(self, weight: float, height: Optional[float] = None,
+                 length_pool: Optional[float] = None,
+                 count_pool: Optional[float] = None) -> None:
+        self.weight: float = weight
+        self.height: Optional[float] = height
+        self.length_pool: Optional[float] = length_pool
+        self.count_pool: Optional[float] = count_pool
+        # Первое слагаемое формулы ходьбы.
+        self.walking_base: float = SportsWalking.WEIGHT_MULTIPLIER_1 * weight
+        # Дистанция бассейна в км: префикс формулы скорости плавания.
+        self.pool_km: Optional[float] = None
+        if length_pool is not None and count_pool is not None:
+            self.pool_km = length_pool * count_pool / Swimming.M_IN_KM
+        # (x * 2) * w == x * (2 * w), пока множитель — степень двойки.
+        self.swimming_weight: Optional[float] = None
+        if _is_power_of_two(Swimming.CAL_MULTIPLIER):
+            self.swimming_weight = Swimming.CAL_MULTIPLIER * weight
+
+    def running(self, action: float, duration: float) -> InfoMessage:
+        """Бег: результат `Running(action, duration, weight)`."""
+        distance: float = action * Running.LEN_STEP / Running.M_IN_KM
+        speed: float = distance / duration
+        calories: float = ((Running.CAL_MULTIPLIER * speed
+                            - Running.СAL_SHIFT)
+                           * self.weight
+                           / Running.M_IN_KM
+                           * (duration * Running.MIN_IN_HOUR))
+        return InfoMessage(Running.__name__, duration, distance, speed,
+                           calories)
+
+    def walking(self, action: float, duration: float) -> InfoMessage:
+        """Ходьба: результат `SportsWalking(..., weight, height)`."""
+        if self.height is None:
+            raise ValueError('Для ходьбы в профиле нужен рост')
+        distance: float = (action * SportsWalking.LEN_STEP
+                           / SportsWalking.M_IN_KM)
+        speed: float = distance / duration
+        quotient: float = speed ** 2 // self.height
+        if quotient == 0:
+            # base + 0.0 * ... == base: второе слагаемое не нужно.
+            weight_part: float = self.walking_base
+        else:
+            weight_part = (self.walking_base
+                           + quotient * SportsWalking.WEIGHT_MULTIPLIER_2
+                           * self.weight)
+        calories: float = weight_part * (duration
+                                         * SportsWalking.MIN_IN_HOUR)
+        return InfoMessage(SportsWalking.__name__, duration, distance,
+                           speed, calories)
+
+    def swimming(self, action: float, duration: float) -> InfoMessage:
+        """Плавание: результат `Swimming(..., length_pool, count_pool)`."""
+        if self.pool_km is None:
+            raise ValueError('Для плавания в профиле нужны параметры '
+                             'бассейна')
+        distance: float = action * Swimming.LEN_STEP / Swimming.M_IN_KM
+        speed: float = self.pool_km / duration
+        if self.swimming_weight is not None:
+            calories: float = ((speed + Swimming.CAL_SHIFT)
+                               * self.swimming_weight)
+        else:
+            calories = ((speed + Swimming.CAL_SHIFT)
+                        * Swimming.CAL_MULTIPLIER * self.weight)
+        return InfoMessage(Swimming.__name__, duration, distance, speed,
+                           calories)
+
+    # Методы расчёта по кодам тренировок; строится один раз на класс.
+    METHODS: ClassVar[Dict[str, Callable[..., InfoMessage]]] = {
+        'RUN': running,
+        'WLK': walking,
+        'SWM': swimming,
+    }
+
+    def compute(self, workout_type: str, action: float,
+                duration: float) -> InfoMessage:
+        """Рассчитать сеанс по коду тренировки."""
+        method: Optional[Callable[..., InfoMessage]] = self.METHODS.get(
+            workout_type)
+        if method is None:
+            raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+        return method(self, action, duration)
+
+
+class ProfileIndex:
+    """Профили спортсменов по идентификатору."""
+
+    def __init__(self) -> None:
+        self.profiles: Dict[Hashable, AthleteProfile] = {}
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def __contains__(self, athlete: Hashable) -> bool:
+        return athlete in self.profiles
+
+    def add(self, athlete: Hashable, weight: float,
+            height: Optional[float] = None,
+            length_pool: Optional[float] = None,
+            count_pool: Optional[float] = None) -> AthleteProfile:
+        """Создать или заменить профиль спортсмена."""
+        profile = AthleteProfile(weight, height, length_pool, count_pool)
+        self.profiles[athlete] = profile
+        return profile
+
+    def compute(self, athlete: Hashable, workout_type: str,
+                action: float, duration: float) -> InfoMessage:
+        """Рассчитать сеанс спортсмена по его профилю."""
+        try:
+            profile: AthleteProfile = self.profiles[athlete]
+        except KeyError:
+            raise KeyError(f'Нет профиля спортсмена {athlete!r}') from None
+        return profile.compute(workout_type, action, duration)
@@ -0,0 +1,212 @@
+"""Замеры времени по этапам расчёта тренировок.
+
+Профилировщик ничего не меняет, пока не вызван `install()`: тогда он
+оборачивает `read_package`, фабрики классов, `get_spent_calories`,
+`show_training_info`, `get_message` и `print` в `main()` и считает
+вызовы, суммарное время и гистограмму длительностей по этапам и типам
+тренировок. `uninstall()` возвращает исходные функции, поэтому
+выключенные замеры не стоят ничего.
+"""
+import json
+import sys
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import homework
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5,
+                                      5e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+ALL_TYPES: str = '*'
+_MISSING = object()
+
+StageKey = Tuple[str, str]
+
+
+class StageStats:
+    """Счётчики одного этапа для одного типа тренировки."""
+
+    __slots__ = ('count', 'total', 'histogram')
+
+    def __init__(self, buckets: int) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.histogram: List[int] = [0] * (buckets + 1)
+
+
+class Profiler:
+    """Сборщик замеров по этапам конвейера."""
+
+    def __init__(self,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+                 ) -> None:
+        self.buckets: Tuple[float, ...] = buckets
+        self.stats: Dict[StageKey, StageStats] = {}
+        self._patches: List[Tuple[Any, str, Any]] = []
+
+    def record(self, stage: str, workout: str, seconds: float) -> None:
+        """Учесть один вызов этапа длительностью `seconds`."""
+        key: StageKey = (stage, workout)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = StageStats(len(self.buckets))
+        stats.count += 1
+        stats.total += seconds
+        stats.histogram[bisect_left(self.buckets, seconds)] += 1
+
+    def reset(self) -> None:
+        """Сбросить накопленные замеры."""
+        self.stats.clear()
+
+    def timed(self, stage: str, function: Callable,
+              workout_of: Callable[..., str]) -> Callable:
+        """Обернуть функцию замером времени этапа `stage`."""
+        clock = time.perf_counter
+        record = self.record
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started: float = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(stage, workout_of(*args), clock() - started)
+        return wrapper
+
+    def _patch(self, owner: Any, name: str, value: Any) -> None:
+        """Подменить атрибут (или ключ словаря), запомнив исходный."""
+        if isinstance(owner, dict):
+            self._patches.append((owner, name, owner.get(name, _MISSING)))
+            owner[name] = value
+        else:
+            self._patches.append((owner, name,
+                                  vars(owner).get(name, _MISSING)))
+            setattr(owner, name, value)
+
+    def install(self) -> 'Profiler':
+        """Включить замеры."""
+        if self._patches:
+            return self
+
+        def by_code(workout_type: str, *args: Any) -> str:
+            cls = homework.WORKOUT_TYPES.get(workout_type)
+            return cls.__name__ if cls else str(workout_type)
+
+        def by_self(training: Any, *args: Any) -> str:
+            return type(training).__name__
+
+        def by_message(info: Any, *args: Any) -> str:
+            return info.training_type
+
+        original_read = homework.read_package
+        timed_read = self.timed('read_package', original_read, by_code)
+        for module in list(sys.modules.values()):
+            if getattr(module, 'read_package', None) is original_read:
+                self._patch(module, 'read_package', timed_read)
+        for code, factory in list(homework.WORKOUT_FACTORIES.items()):
+            name: str = homework.WORKOUT_TYPES[code].__name__
+            self._patch(homework.WORKOUT_FACTORIES, code, self.timed(
+                'construct', factory, lambda *args, name=name: name,
+            ))
+        for cls in set(homework.WORKOUT_TYPES.values()):
+            if 'get_spent_calories' not in vars(cls):
+                continue
+            self._patch(cls, 'get_spent_calories', self.timed(
+                'get_spent_calories', cls.get_spent_calories, by_self,
+            ))
+        self._patch(homework.Training, 'show_training_info', self.timed(
+            'show_training_info', homework.Training.show_training_info,
+            by_self,
+        ))
+        self._patch(homework.InfoMessage, 'get_message', self.timed(
+            'get_message', homework.InfoMessage.get_message, by_message,
+        ))
+        self._patch(homework, 'print', self.timed(
+            'print', print, lambda *args: ALL_TYPES,
+        ))
+        return self
+
+    def uninstall(self) -> None:
+        """Выключить замеры и вернуть исходные функции."""
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            if isinstance(owner, dict):
+                if original is _MISSING:
+                    del owner[name]
+                else:
+                    owner[name] = original
+            elif original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    def __enter__(self) -> 'Profiler':
+        return self.install()
+
+    def __exit__(self, *args: Any) -> None:
+        self.uninstall()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Замеры в виде словаря, пригодного для JSON."""
+        return {
+            'buckets': list(self.buckets),
+            'stages': [
+                {'stage': stage,
+                 'workout': workout,
+                 'count': stats.count,
+                 'total_seconds': stats.total,
+                 'histogram': list(stats.histogram),
+                 }
+                for (stage, workout), stats in sorted(self.stats.items())
+            ],
+        }
+
+    def to_json(self) -> str:
+        """Замеры в формате JSON."""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Замеры в текстовом формате Prometheus (гистограммы)."""
+        name: str = 'training_stage_seconds'
+        lines: List[str] = [
+            f'# HELP {name} Время этапов расчёта тренировок.',
+            f'# TYPE {name} histogram',
+        ]
+        for (stage, workout), stats in sorted(self.stats.items()):
+            labels: str = f'stage="{stage}",workout="{workout}"'
+            cumulative: int = 0
+            edges = [repr(edge) for edge in self.buckets] + ['+Inf']
+            for edge, count in zip(edges, stats.histogram):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{edge}"}} '
+                             f'{cumulative}')
+            lines.append(f'{name}_sum{{{labels}}} {stats.total!r}')
+            lines.append(f'{name}_count{{{labels}}} {stats.count}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str) -> None:
+        """Сохранить замеры в файл: `.prom`/`.txt` — Prometheus, иначе JSON."""
+        prometheus: bool = path.endswith(('.prom', '.txt'))
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(self.to_prometheus() if prometheus else self.to_json())
+
+    def report(self) -> str:
+        """Таблица с разбивкой по этапам и типам тренировок."""
+        lines: List[str] = [f'{"этап":<20}{"тренировка":<15}{"вызовов":>10}'
+                            f'{"всего, с":>12}{"среднее, мкс":>14}']
+        for (stage, workout), stats in sorted(self.stats.items()):
+            mean: float = stats.total / stats.count * 1e6
+            lines.append(f'{stage:<20}{workout:<15}{stats.count:>10}'
+                         f'{stats.total:>12.4f}{mean:>14.2f}')
+        return '\n'.join(lines)
+
+
+def profile(function: Callable[..., Any], *args: Any,
+            profiler: Optional[Profiler] = None, **kwargs: Any,
+            ) -> Tuple[Any, Profiler]:
+    """Выполнить `function` с включёнными замерами."""
+    profiler = profiler or Profiler()
+    with profiler:
+        result = function(*args, **kwargs)
+    return result, profiler
@@ -0,0 +1,223 @@
+"""Быстрый запуск расчёта для коротких вызовов из cron и скриптов.
+
+    python quick.py RUN 15000 1 75          # пакет из аргументов
+    python quick.py < packages.ndjson       # NDJSON или CSV из stdin
+    python quick.py --serve                 # постоянный процесс
+
+Модуль импортирует только `os`, `stat` и `sys`; `socket` загружается,
+лишь когда нужно обратиться к постоянному процессу. Если запущен
+постоянный процесс (`--serve`), пакеты отправляются ему через
+Unix-сокет и расчётные модули вовсе не загружаются; иначе `homework`
+с `dataclasses` импортируется лениво, уже при расчёте.
+"""
+import os
+import stat
+import sys
+
+SOCKET_ENV: str = 'TRAINING_WORKER_SOCKET'
+ERROR_PREFIX: str = 'ERROR: '
+WORKER_TIMEOUT: float = 5.0
+
+
+def runtime_dir() -> str:
+    """Личный каталог для сокета.
+
+    Это `$XDG_RUNTIME_DIR`, а без него — `/tmp/training-worker-<uid>`
+    с правами 0700: каталог должен принадлежать текущему пользователю
+    и быть закрыт для остальных, иначе сокет мог бы подменить другой
+    пользователь.
+    """
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime:
+        return runtime
+    path = os.path.join('/tmp', f'training-worker-{os.getuid()}')
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if (not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid()
+            or info.st_mode & 0o077):
+        raise PermissionError(f'Небезопасный каталог для сокета: {path}')
+    return path
+
+
+def socket_path() -> str:
+    """Путь к Unix-сокету постоянного процесса."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    return os.path.join(runtime_dir(), 'training-worker.sock')
+
+
+def is_own_socket(path: str) -> bool:
+    """Сокет ли по пути `path` и создан ли он текущим пользователем."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def to_ndjson(workout_type: str, values: list) -> str:
+    """Собрать строку NDJSON для пакета без модуля `json`."""
+    if not workout_type.isalnum():
+        raise ValueError(f'Некорректный код тренировки: {workout_type!r}')
+    numbers = ', '.join(repr(float(value)) for value in values)
+    return f'["{workout_type}", [{numbers}]]'
+
+
+def to_package(workout_type: object, values: object) -> 'tuple | str':
+    """Пакет `(код, числа)` или строка ошибки, если его не разобрать."""
+    try:
+        if not isinstance(workout_type, str) or not workout_type.isalnum():
+            raise ValueError(f'Некорректный код тренировки: {workout_type!r}')
+        if not isinstance(values, list):
+            raise TypeError('данные пакета должны быть списком')
+        return workout_type, [float(value) for value in values]
+    except (ValueError, TypeError) as error:
+        return f'{ERROR_PREFIX}{type(error).__name__}: {error}'
+
+
+def parse_json(line: str) -> 'tuple | str':
+    """Разобрать строку NDJSON; `json` загружается только для таких строк."""
+    import json
+    try:
+        record = json.loads(line)
+        if isinstance(record, dict):
+            return to_package(record['workout_type'], record['data'])
+        workout_type, values = record
+    except (ValueError, TypeError, KeyError) as error:
+        return f'{ERROR_PREFIX}{type(error).__name__}: {error}'
+    return to_package(workout_type, values)
+
+
+def normalize(line: str) -> 'tuple | str | None':
+    """Разобрать строку NDJSON или CSV; `None` для пустой строки."""
+    line = line.strip()
+    if not line:
+        return None
+    if line[0] in '[{':
+        return parse_json(line)
+    workout_type, *values = line.split(',')
+    return to_package(workout_type.strip(), values)
+
+
+def read_requests(argv: list) -> list:
+    """Пакеты из аргументов или stdin.
+
+    Каждый элемент — кортеж `(код, числа)`, а нечитаемые пакеты сразу
+    превращаются в строки с `ERROR_PREFIX`.
+    """
+    if argv:
+        return [to_package(argv[0], argv[1:])]
+    return [request for request in map(normalize, sys.stdin)
+            if request is not None]
+
+
+def ask_worker(path: str, requests: list,
+               timeout: 'float | None' = None) -> 'list | None':
+    """Отправить строки NDJSON постоянному процессу.
+
+    Возвращает `None`, если процесса нет, сокет создан другим
+    пользователем или ответ не пришёл за `timeout` секунд
+    (по умолчанию `WORKER_TIMEOUT`).
+    """
+    if not is_own_socket(path):
+        return None
+    import socket
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(WORKER_TIMEOUT if timeout is None
+                              else timeout)
+            client.connect(path)
+            client.sendall(('\n'.join(requests) + '\n').encode('utf-8'))
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b''.join(chunks).decode('utf-8').splitlines()
+
+
+def compute_locally(packages: list) -> list:
+    """Рассчитать пакеты `(код, числа)` в текущем процессе."""
+    from homework import read_package
+    replies = []
+    for workout_type, data in packages:
+        try:
+            info = read_package(workout_type, data).show_training_info()
+            replies.append(info.get_message())
+        except Exception as error:
+            replies.append(f'{ERROR_PREFIX}{type(error).__name__}: {error}')
+    return replies
+
+
+def serve(path: str) -> None:
+    """Запустить постоянный процесс на Unix-сокете `path`."""
+    import asyncio
+    from server import TrainingServer
+
+    async def run() -> None:
+        listener = await TrainingServer().start_unix(path)
+        async with listener:
+            await listener.serve_forever()
+
+    if os.path.lexists(path):
+        if not is_own_socket(path):
+            raise PermissionError(f'{path} занят не сокетом текущего '
+                                  'пользователя')
+        os.unlink(path)
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if is_own_socket(path):
+            os.unlink(path)
+
+
+def main(argv: 'list | None' = None) -> int:
+    """Точка входа командной строки, возвращает код завершения."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == '--serve':
+        serve(argv[1] if len(argv) > 1 else socket_path())
+        return 0
+    local = bool(argv) and argv[0] == '--local'
+    if local:
+        argv = argv[1:]
+    requests = read_requests(argv)
+    packages = [request for request in requests
+                if isinstance(request, tuple)]
+    computed = None
+    if not local and packages:
+        try:
+            computed = ask_worker(socket_path(), [to_ndjson(*package)
+                                                  for package in packages])
+        except OSError:
+            computed = None
+    if computed is None:
+        computed = compute_locally(packages)
+    answers = iter(computed)
+    replies = [next(answers, f'{ERROR_PREFIX}нет ответа')
+               if isinstance(request, tuple) else request
+               for request in requests]
+    status = 0
+    output = []
+    for reply in replies:
+        if reply.startswith(ERROR_PREFIX):
+            sys.stderr.write(reply + '\n')
+            status = 1
+        else:
+            output.append(reply)
+    if output:
+        sys.stdout.write('\n'.join(output) + '\n')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
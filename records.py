@@ -0,0 +1,142 @@
+"""Компактное хранение тренировок: классы со __slots__ и колонки."""
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type
+
+from batch import compute_batch
+from homework import WORKOUT_TYPES, InfoMessage, Training, init_fields
+
+WIDTH: int = 5
+SKIPPED_ATTRIBUTES: Tuple[str, ...] = ('__dict__', '__weakref__', '__init__')
+DATACLASS_ATTRIBUTES: Tuple[str, ...] = ('__dataclass_fields__',
+                                         '__dataclass_params__',
+                                         '__match_args__',
+                                         '__init__',
+                                         '__repr__',
+                                         '__eq__',
+                                         '__hash__',
+                                         )
+
+
+def _slotted_init(self: Any, *values: float) -> None:
+    """Заполнить слоты значениями из пакета."""
+    if len(values) != len(self.__slots__):
+        raise TypeError(f'{type(self).__name__} ожидает '
+                        f'{len(self.__slots__)} значений, '
+                        f'получено {len(values)}')
+    for name, value in zip(self.__slots__, values):
+        setattr(self, name, value)
+
+
+def _slotted_show_training_info(self: Any) -> Any:
+    """Вернуть компактное информационное сообщение о тренировке."""
+    return SlottedInfoMessage(training_type=type(self).__name__,
+                              duration=self.duration,
+                              distance=self.get_distance(),
+                              speed=self.get_mean_speed(),
+                              calories=self.get_spent_calories(),
+                              )
+
+
+def slotted_training(cls: Type[Training]) -> type:
+    """Построить вариант класса тренировки без `__dict__` у экземпляров.
+
+    Методы и константы копируются из всей иерархии `cls`, поэтому
+    расчёты и имя класса в сообщении совпадают с исходным классом.
+    """
+    namespace: Dict[str, Any] = {}
+    for base in reversed(cls.__mro__[:-1]):
+        namespace.update((name, value) for name, value in vars(base).items()
+                         if name not in SKIPPED_ATTRIBUTES)
+    namespace['__slots__'] = init_fields(cls)
+    namespace['__init__'] = _slotted_init
+    namespace['show_training_info'] = _slotted_show_training_info
+    namespace['__qualname__'] = cls.__qualname__
+    return type(cls.__name__, (), namespace)
+
+
+def slotted_dataclass(cls: type) -> type:
+    """Построить вариант dataclass со __slots__ вместо `__dict__`."""
+    namespace: Dict[str, Any] = {
+        name: value for name, value in vars(cls).items()
+        if name not in SKIPPED_ATTRIBUTES + DATACLASS_ATTRIBUTES
+    }
+    namespace['__slots__'] = tuple(field.name for field in fields(cls))
+    return dataclass(type(cls.__name__, (), namespace))
+
+
+SlottedInfoMessage: type = slotted_dataclass(InfoMessage)
+SLOTTED_CLASSES: Dict[str, type] = {
+    workout_type: slotted_training(cls)
+    for workout_type, cls in WORKOUT_TYPES.items()
+}
+
+
+def read_slotted_package(workout_type: str, data: list) -> Any:
+    """Прочитать пакет в компактный вариант класса тренировки."""
+    if workout_type not in SLOTTED_CLASSES:
+        raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+    return SLOTTED_CLASSES[workout_type](*data)
+
+
+class TrainingColumns:
+    """Набор тренировок, хранящийся по колонкам.
+
+    Коды тренировок лежат в `array('B')` индексами в `codes`, поля
+    пакетов — в `WIDTH` колонках `array('d')`; отсутствующие у
+    тренировки поля заполняются нулями.
+    """
+
+    def __init__(self) -> None:
+        self.codes: List[str] = list(WORKOUT_TYPES)
+        self.code_indexes: array = array('B')
+        self.arity: List[int] = [len(init_fields(WORKOUT_TYPES[code]))
+                                 for code in self.codes]
+        self.columns: List[array] = [array('d') for _ in range(WIDTH)]
+
+    def __len__(self) -> int:
+        return len(self.code_indexes)
+
+    def append(self, workout_type: str, data: list) -> None:
+        """Добавить пакет в конец набора."""
+        if workout_type not in WORKOUT_TYPES:
+            raise ValueError(f'Неизвестный код тренировки: {workout_type!r}')
+        code_index: int = self.codes.index(workout_type)
+        if len(data) != self.arity[code_index]:
+            raise TypeError(f'Пакет {workout_type!r} должен содержать '
+                            f'{self.arity[code_index]} значений')
+        self.code_indexes.append(code_index)
+        for position, column in enumerate(self.columns):
+            column.append(data[position] if position < len(data) else 0.0)
+
+    def extend(self, packages: Iterable[Tuple[str, list]]) -> None:
+        """Добавить несколько пакетов."""
+        for workout_type, data in packages:
+            self.append(workout_type, data)
+
+    def workout_type(self, index: int) -> str:
+        """Код тренировки в строке `index`."""
+        return self.codes[self.code_indexes[index]]
+
+    def package(self, index: int) -> Tuple[str, List[float]]:
+        """Пакет `(workout_type, data)` в строке `index`."""
+        code_index: int = self.code_indexes[index]
+        data: List[float] = [column[index] for column
+                             in self.columns[:self.arity[code_index]]]
+        return self.codes[code_index], data
+
+    def __getitem__(self, index: int) -> Any:
+        """Тренировка в строке `index`, совместимая с `Training`."""
+        return read_slotted_package(*self.package(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def workout_types(self) -> List[str]:
+        """Коды тренировок всех строк."""
+        return [self.codes[code_index] for code_index in self.code_indexes]
+
+    def compute(self) -> Dict[str, array]:
+        """Рассчитать все строки пакетным способом."""
+        return compute_batch(self.workout_types(), self.columns)
@@ -0,0 +1,170 @@
+"""Asyncio-сервер для расчёта тренировок по пакетам с устройств.
+
+Протокол построчный: клиент присылает пакет в формате NDJSON
+(`["RUN", [15000, 1, 75]]`), сервер отвечает строкой
+`InfoMessage.get_message()` или строкой `ERROR: <описание>`.
+Ответы приходят в том же порядке, что и запросы.
+"""
+import argparse
+import asyncio
+from typing import List, Optional, Sequence, Tuple
+
+from homework import read_package
+from streaming import Package, parse_ndjson_line
+
+DEFAULT_QUEUE_SIZE: int = 1024
+DEFAULT_BATCH_SIZE: int = 256
+DEFAULT_PENDING_PER_CLIENT: int = 256
+ERROR_PREFIX: str = 'ERROR: '
+
+Job = Tuple[Package, 'asyncio.Future[str]']
+
+
+class TrainingServer:
+    """Сервер с ограниченными очередями и расчётом микро-пачками.
+
+    Все клиенты складывают пакеты в общую очередь размера `queue_size`;
+    когда она заполнена, чтение из сокетов приостанавливается.
+    Расчётная задача забирает из очереди до `batch_size` пакетов за раз.
+    """
+
+    def __init__(self,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 pending_per_client: int = DEFAULT_PENDING_PER_CLIENT,
+                 ) -> None:
+        self.queue_size: int = queue_size
+        self.batch_size: int = batch_size
+        self.pending_per_client: int = pending_per_client
+        self.jobs: Optional['asyncio.Queue[Job]'] = None
+        self.processed: int = 0
+        self.batches: int = 0
+        self._compute_task: Optional['asyncio.Task[None]'] = None
+
+    def _ensure_started(self) -> None:
+        """Создать очередь и расчётную задачу в текущем цикле событий."""
+        if self._compute_task is None:
+            self.jobs = asyncio.Queue(self.queue_size)
+            self._compute_task = asyncio.ensure_future(self._compute_loop())
+
+    @staticmethod
+    def compute(package: Package) -> str:
+        """Рассчитать один пакет."""
+        workout_type, data = package
+        return read_package(workout_type, data).show_training_info(
+        ).get_message()
+
+    async def _compute_loop(self) -> None:
+        """Забирать пакеты из очереди пачками и рассчитывать их."""
+        while True:
+            batch: List[Job] = [await self.jobs.get()]
+            while len(batch) < self.batch_size and not self.jobs.empty():
+                batch.append(self.jobs.get_nowait())
+            for package, future in batch:
+                if future.cancelled():
+                    continue
+                try:
+                    future.set_result(self.compute(package))
+                except Exception as error:
+                    future.set_exception(error)
+            self.processed += len(batch)
+            self.batches += 1
+            await asyncio.sleep(0)
+
+    async def _reply(self,
+                     writer: asyncio.StreamWriter,
+                     pending: 'asyncio.Queue[Optional[asyncio.Future[str]]]',
+                     ) -> None:
+        """Отправлять клиенту ответы в порядке запросов."""
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            try:
+                line: str = await future
+            except Exception as error:
+                line = f'{ERROR_PREFIX}{type(error).__name__}: {error}'
+            writer.write(line.encode('utf-8') + b'\n')
+            await writer.drain()
+
+    async def handle_client(self,
+                            reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter,
+                            ) -> None:
+        """Обслужить одно соединение."""
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        pending: 'asyncio.Queue[Optional[asyncio.Future[str]]]' = (
+            asyncio.Queue(self.pending_per_client)
+        )
+        replier = asyncio.ensure_future(self._reply(writer, pending))
+        try:
+            async for raw in reader:
+                line: str = raw.decode('utf-8').strip()
+                if not line:
+                    continue
+                future: 'asyncio.Future[str]' = loop.create_future()
+                try:
+                    package: Package = parse_ndjson_line(line)
+                except (ValueError, TypeError, KeyError) as error:
+                    future.set_exception(error)
+                else:
+                    await self.jobs.put((package, future))
+                await pending.put(future)
+            await pending.put(None)
+            await replier
+        finally:
+            replier.cancel()
+            writer.close()
+
+    async def start_tcp(self, host: str = '127.0.0.1',
+                        port: int = 0) -> asyncio.AbstractServer:
+        """Запустить сервер на TCP-порту."""
+        self._ensure_started()
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Запустить сервер на Unix-сокете."""
+        self._ensure_started()
+        return await asyncio.start_unix_server(self.handle_client, path)
+
+    async def close(self) -> None:
+        """Остановить расчётную задачу."""
+        if self._compute_task is not None:
+            self._compute_task.cancel()
+            try:
+                await self._compute_task
+            except asyncio.CancelledError:
+                pass
+            self._compute_task = None
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Запустить сервер по аргументам командной строки и ждать вечно."""
+    server = TrainingServer(args.queue_size, args.batch_size)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Собрать парсер аргументов командной строки."""
+    parser = argparse.ArgumentParser(description='Сервер расчёта тренировок.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='путь к Unix-сокету вместо TCP')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Точка входа командной строки."""
+    asyncio.run(serve(build_parser().parse_args(argv)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""Буферизованный вывод результатов в файлы, архивы и память."""
+import gzip
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+from formatting import format_message
+from homework import InfoMessage
+
+FIELDS: Tuple[str, ...] = ('training_type', 'duration', 'distance',
+                           'speed', 'calories')
+DEFAULT_BUFFER_SIZE: int = 64 * 1024
+DEFAULT_FLUSH_INTERVAL: float = 1.0
+DEFAULT_QUEUE_SIZE: int = 64
+
+
+def serialize_text(info: InfoMessage) -> str:
+    """Строка отчёта, как у `get_message`."""
+    return format_message(info) + '\n'
+
+
+def serialize_jsonl(info: InfoMessage) -> str:
+    """Строка JSON Lines с полями сообщения."""
+    return json.dumps({name: getattr(info, name) for name in FIELDS},
+                      ensure_ascii=False) + '\n'
+
+
+def serialize_csv(info: InfoMessage) -> str:
+    """Строка CSV с полями сообщения в порядке `FIELDS`."""
+    return (f'{info.training_type},{info.duration!r},{info.distance!r},'
+            f'{info.speed!r},{info.calories!r}\n')
+
+
+SERIALIZERS: Dict[str, Callable[[InfoMessage], str]] = {
+    'text': serialize_text,
+    'jsonl': serialize_jsonl,
+    'csv': serialize_csv,
+}
+HEADERS: Dict[str, str] = {'csv': ','.join(FIELDS) + '\n'}
+
+
+class Sink:
+    """Получатель готовых блоков текста."""
+
+    def write(self, text: str) -> None:
+        raise NotImplementedError
+
+    def set_header(self, header: str) -> None:
+        """Записать заголовок (например, строку колонок CSV)."""
+        self.write(header)
+
+    def flush(self) -> None:
+        """Сбросить данные на носитель."""
+
+    def close(self) -> None:
+        """Закрыть получателя."""
+        self.flush()
+
+
+class MemorySink(Sink):
+    """Накопление вывода в памяти."""
+
+    def __init__(self) -> None:
+        self.chunks: List[str] = []
+
+    def write(self, text: str) -> None:
+        self.chunks.append(text)
+
+    def getvalue(self) -> str:
+        """Весь записанный текст."""
+        return ''.join(self.chunks)
+
+
+class StreamSink(Sink):
+    """Запись в уже открытый текстовый поток, например stdout."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream: IO[str] = stream
+
+    def write(self, text: str) -> None:
+        self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class FileSink(StreamSink):
+    """Буферизованная запись в файл."""
+
+    def __init__(self, path: str, mode: str = 'w',
+                 encoding: str = 'utf-8',
+                 buffering: int = DEFAULT_BUFFER_SIZE) -> None:
+        super().__init__(open(path, mode, encoding=encoding,
+                              buffering=buffering))
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class GzipSink(StreamSink):
+    """Запись в файл gzip."""
+
+    def __init__(self, path: str, mode: str = 'wt',
+                 encoding: str = 'utf-8', compresslevel: int = 6) -> None:
+        super().__init__(gzip.open(path, mode, encoding=encoding,
+                                   compresslevel=compresslevel))
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class RotatingShardSink(Sink):
+    """Запись в набор файлов-шардов ограниченного размера.
+
+    Шарды называются `{prefix}-00000{suffix}`, `{prefix}-00001{suffix}`
+    и т.д.; новый начинается, когда текущий достиг `max_bytes`. Если
+    `suffix` оканчивается на `.gz`, шарды сжимаются. `header`
+    записывается в начало каждого шарда.
+    """
+
+    def __init__(self, directory: str, prefix: str = 'trainings',
+                 suffix: str = '.txt', max_bytes: int = 64 * 2 ** 20,
+                 header: str = '', encoding: str = 'utf-8') -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.prefix: str = prefix
+        self.suffix: str = suffix
+        self.max_bytes: int = max_bytes
+        self.header: str = header
+        self.encoding: str = encoding
+        self.paths: List[str] = []
+        self._stream: Optional[IO[str]] = None
+        self._size: int = 0
+
+    def _open_next(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+        path: str = os.path.join(
+            self.directory, f'{self.prefix}-{len(self.paths):05d}{self.suffix}'
+        )
+        if self.suffix.endswith('.gz'):
+            self._stream = gzip.open(path, 'wt', encoding=self.encoding)
+        else:
+            self._stream = open(path, 'w', encoding=self.encoding,
+                                buffering=DEFAULT_BUFFER_SIZE)
+        self.paths.append(path)
+        self._size = 0
+        if self.header:
+            self._write(self.header)
+
+    def set_header(self, header: str) -> None:
+        self.header = header
+
+    def _write(self, text: str) -> None:
+        self._stream.write(text)
+        self._size += len(text.encode(self.encoding))
+
+    def write(self, text: str) -> None:
+        if self._stream is None or self._size >= self.max_bytes:
+            self._open_next()
+        self._write(text)
+
+    def flush(self) -> None:
+        if self._stream is not None:
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class OutputWriter:
+    """Сериализация сообщений с пакетной записью в `Sink`.
+
+    Строки копятся в буфере и уходят в получателя одним блоком, когда
+    буфер превысил `buffer_size` символов или с прошлой записи прошло
+    `flush_interval` секунд; во втором случае получатель ещё и
+    сбрасывается на носитель. С `background=True` блоки пишет отдельный
+    поток через очередь из `queue_size` блоков, и расчёт не ждёт диска,
+    пока очередь не заполнена; этот же поток сбрасывает буфер, если
+    новых сообщений нет дольше `flush_interval`. Без фонового потока
+    срок проверяется при очередной записи.
+    """
+
+    def __init__(self, sink: Sink, fmt: str = 'text',
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 background: bool = False,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 header: bool = True) -> None:
+        if fmt not in SERIALIZERS:
+            raise ValueError(f'Неизвестный формат вывода: {fmt!r}')
+        self.sink: Sink = sink
+        self.serialize: Callable[[InfoMessage], str] = SERIALIZERS[fmt]
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float = flush_interval
+        self.written: int = 0
+        self._buffer: List[str] = []
+        self._buffered: int = 0
+        self._last_flush: float = time.monotonic()
+        self._error: Optional[BaseException] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._queue: Optional['queue.Queue[Optional[Tuple[str, bool]]]'] = (
+            None
+        )
+        self._thread: Optional[threading.Thread] = None
+        if header and fmt in HEADERS:
+            sink.set_header(HEADERS[fmt])
+        if background:
+            self._queue = queue.Queue(queue_size)
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+
+    def _write_sink(self, chunk: str, sync: bool) -> None:
+        if chunk:
+            self.sink.write(chunk)
+        if sync:
+            self.sink.flush()
+
+    def _drain(self) -> None:
+        """Цикл фонового потока записи."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_stale()
+                continue
+            if item is None:
+                return
+            try:
+                self._write_sink(*item)
+            except BaseException as error:
+                self._error = error
+
+    def _flush_stale(self) -> None:
+        """Сбросить буфер из фонового потока, если он лежит слишком долго.
+
+        Блокировка берётся без ожидания: если главный поток сейчас сам
+        передаёт буфер, делать ничего не нужно. Пустая очередь под
+        блокировкой значит, что все прежние блоки уже записаны, так что
+        порядок строк сохраняется.
+        """
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if (self._buffer and self._queue.empty()
+                    and time.monotonic() - self._last_flush
+                    >= self.flush_interval):
+                self._write_sink(self._take(), True)
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._lock.release()
+
+    def _take(self) -> str:
+        chunk: str = ''.join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        return chunk
+
+    def write(self, info: InfoMessage) -> None:
+        """Добавить одно сообщение."""
+        line: str = self.serialize(info)
+        with self._lock:
+            self._buffer.append(line)
+            self._buffered += len(line)
+            self.written += 1
+        if self._buffered >= self.buffer_size:
+            self.flush_buffer()
+        elif time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush_buffer(sync=True)
+
+    def write_many(self, infos: Any) -> None:
+        """Добавить несколько сообщений."""
+        for info in infos:
+            self.write(info)
+
+    def flush_buffer(self, sync: bool = False) -> None:
+        """Передать накопленный буфер получателю.
+
+        С `sync=True` получатель затем сбрасывается на носитель.
+        """
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            chunk: str = self._take()
+            if not chunk and not sync:
+                return
+            if self._queue is not None:
+                self._queue.put((chunk, sync))
+            else:
+                self._write_sink(chunk, sync)
+
+    def close(self) -> None:
+        """Дописать буфер, остановить фоновый поток, закрыть получателя.
+
+        Поток и получатель закрываются, даже если запись упала; ошибка
+        записи после этого пробрасывается.
+        """
+        try:
+            self.flush_buffer()
+        finally:
+            try:
+                if self._thread is not None:
+                    self._queue.put(None)
+                    self._thread.join()
+                    self._thread = None
+            finally:
+                self.sink.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> 'OutputWriter':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def open_sink(path: str) -> Sink:
+    """Подобрать получателя по пути: `-` — stdout, `.gz` — gzip."""
+    if path == '-':
+        return StreamSink(sys.stdout)
+    if path.endswith('.gz'):
+        return GzipSink(path)
+    return FileSink(path)
@@ -0,0 +1,222 @@
+"""Однопроходная статистика по большим историям тренировок.
+
+Для каждого типа тренировки и показателя хранятся количество,
+минимум, максимум, среднее и дисперсия (алгоритм Уэлфорда) и
+квантильный скетч с логарифмическими корзинами (как DDSketch):
+квантили считаются с относительной погрешностью `relative_accuracy`,
+а память зависит от разброса значений, а не от их количества. Все
+объекты сливаются через `merge`, поэтому частичные результаты шардов
+или процессов можно объединять.
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from homework import InfoMessage, read_package
+
+METRICS: Tuple[str, ...] = ('distance', 'speed', 'calories')
+DEFAULT_RELATIVE_ACCURACY: float = 0.01
+DEFAULT_PERCENTILES: Tuple[float, ...] = (50, 90, 99)
+
+
+class QuantileSketch:
+    """Сливаемый скетч квантилей с относительной погрешностью."""
+
+    def __init__(self,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy должна быть в (0, 1)')
+        self.relative_accuracy: float = relative_accuracy
+        self.gamma: float = ((1 + relative_accuracy)
+                             / (1 - relative_accuracy))
+        self._log_gamma: float = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero: int = 0
+        self.count: int = 0
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Учесть значение."""
+        self.count += 1
+        if value > 0:
+            store = self.positive
+        elif value < 0:
+            store = self.negative
+            value = -value
+        else:
+            self.zero += 1
+            return
+        index: int = self._index(value)
+        store[index] = store.get(index, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Добавить содержимое другого скетча с той же точностью."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('Сливать можно скетчи с одинаковой точностью')
+        for store, other_store in ((self.positive, other.positive),
+                                   (self.negative, other.negative)):
+            for index, count in other_store.items():
+                store[index] = store.get(index, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Пары (представитель корзины, количество) по возрастанию."""
+        result: List[Tuple[float, int]] = [
+            (-self._value(index), self.negative[index])
+            for index in sorted(self.negative, reverse=True)
+        ]
+        if self.zero:
+            result.append((0.0, self.zero))
+        result.extend((self._value(index), self.positive[index])
+                      for index in sorted(self.positive))
+        return result
+
+    def quantile(self, share: float) -> Optional[float]:
+        """Приближённый квантиль уровня `share` от 0 до 1."""
+        if not self.count:
+            return None
+        rank: float = share * (self.count - 1)
+        seen: int = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen > rank:
+                return value
+        return self.buckets()[-1][0]
+
+
+class MetricStats:
+    """Однопроходная статистика одного показателя."""
+
+    def __init__(self,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 ) -> None:
+        self.count: int = 0
+        self.minimum: float = math.inf
+        self.maximum: float = -math.inf
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+        self.sketch: QuantileSketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        """Учесть значение."""
+        self.count += 1
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.sketch.add(value)
+
+    def merge(self, other: 'MetricStats') -> None:
+        """Добавить статистику другого шарда."""
+        if not other.count:
+            return
+        total: int = self.count + other.count
+        delta: float = other.mean - self.mean
+        self._m2 += other._m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self) -> float:
+        """Выборочная дисперсия."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Приближённый перцентиль (0–100)."""
+        return self.sketch.quantile(percent / 100)
+
+    def histogram(self, bins: int = 10) -> List[Tuple[float, float, int]]:
+        """Гистограмма из `bins` равных интервалов между min и max.
+
+        Значения распределяются по интервалам по представителям корзин
+        скетча, поэтому границы интервалов точны с погрешностью скетча.
+        """
+        if not self.count:
+            return []
+        width: float = (self.maximum - self.minimum) / bins or 1.0
+        counts: List[int] = [0] * bins
+        for value, count in self.sketch.buckets():
+            position: int = int((value - self.minimum) / width)
+            counts[min(max(position, 0), bins - 1)] += count
+        return [(self.minimum + width * index,
+                 self.minimum + width * (index + 1),
+                 counts[index])
+                for index in range(bins)]
+
+
+class TrainingStats:
+    """Статистика показателей по типам тренировок."""
+
+    def __init__(self,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 ) -> None:
+        self.relative_accuracy: float = relative_accuracy
+        self.metrics: Dict[str, Dict[str, MetricStats]] = {}
+
+    def _metrics_for(self, training_type: str) -> Dict[str, MetricStats]:
+        metrics = self.metrics.get(training_type)
+        if metrics is None:
+            metrics = self.metrics[training_type] = {
+                name: MetricStats(self.relative_accuracy) for name in METRICS
+            }
+        return metrics
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть готовое сообщение о тренировке."""
+        metrics = self._metrics_for(info.training_type)
+        for name in METRICS:
+            metrics[name].add(getattr(info, name))
+
+    def add_many(self, infos: Iterable[InfoMessage]) -> None:
+        """Учесть несколько сообщений."""
+        for info in infos:
+            self.add(info)
+
+    def add_package(self, workout_type: str,
+                    data: Sequence[float]) -> None:
+        """Рассчитать пакет и учесть результат."""
+        self.add(read_package(workout_type, data).show_training_info())
+
+    def merge(self, other: 'TrainingStats') -> None:
+        """Добавить статистику другого шарда или процесса."""
+        for training_type, metrics in other.metrics.items():
+            own = self._metrics_for(training_type)
+            for name, metric in metrics.items():
+                own[name].merge(metric)
+
+    def report(self,
+               percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+               bins: int = 0) -> str:
+        """Текстовый отчёт; с `bins > 0` добавляются гистограммы."""
+        header: str = (f'{"тренировка":<15}{"показатель":<11}{"n":>9}'
+                       f'{"min":>11}{"mean":>11}{"max":>11}'
+                       + ''.join(f'{f"p{percent:g}":>11}'
+                                 for percent in percentiles))
+        lines: List[str] = [header]
+        for training_type in sorted(self.metrics):
+            for name, metric in self.metrics[training_type].items():
+                if not metric.count:
+                    continue
+                lines.append(
+                    f'{training_type:<15}{name:<11}{metric.count:>9}'
+                    f'{metric.minimum:>11.3f}{metric.mean:>11.3f}'
+                    f'{metric.maximum:>11.3f}'
+                    + ''.join(f'{metric.percentile(percent):>11.3f}'
+                              for percent in percentiles)
+                )
+                for low, high, count in (metric.histogram(bins)
+                                         if bins else []):
+                    lines.append(f'{"":<26}[{low:>10.3f}; {high:>10.3f})'
+                                 f'{count:>9}')
+        return '\n'.join(lines)
@@ -0,0 +1,178 @@
+"""Постоянное хранилище рассчитанных тренировок в файле SQLite.
+
+Результаты дописываются пачками в транзакциях, а таблица
+проиндексирована по типу тренировки, спортсмену и времени, поэтому
+запросы вида «все заплывы за прошлую неделю» отвечают без пересчёта.
+"""
+import sqlite3
+import time
+from typing import (Hashable, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple)
+
+from homework import InfoMessage, read_package
+
+DEFAULT_BATCH_SIZE: int = 10_000
+WEEK: float = 7 * 24 * 60 * 60
+
+SCHEMA: Tuple[str, ...] = (
+    'CREATE TABLE IF NOT EXISTS trainings ('
+    ' id INTEGER PRIMARY KEY,'
+    ' athlete TEXT NOT NULL,'
+    ' timestamp REAL NOT NULL,'
+    ' training_type TEXT NOT NULL,'
+    ' duration REAL NOT NULL,'
+    ' distance REAL NOT NULL,'
+    ' speed REAL NOT NULL,'
+    ' calories REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS trainings_type_time'
+    ' ON trainings (training_type, timestamp)',
+    'CREATE INDEX IF NOT EXISTS trainings_athlete_time'
+    ' ON trainings (athlete, timestamp)',
+    'CREATE INDEX IF NOT EXISTS trainings_time ON trainings (timestamp)',
+)
+INSERT: str = ('INSERT INTO trainings (athlete, timestamp, training_type,'
+               ' duration, distance, speed, calories)'
+               ' VALUES (?, ?, ?, ?, ?, ?, ?)')
+COLUMNS: str = ('athlete, timestamp, training_type, duration, distance,'
+                ' speed, calories')
+
+Row = Tuple[str, float, str, float, float, float, float]
+
+
+class StoredTraining(NamedTuple):
+    """Сохранённая тренировка."""
+
+    athlete: str
+    timestamp: float
+    info: InfoMessage
+
+
+def to_row(athlete: Hashable, timestamp: float, info: InfoMessage) -> Row:
+    """Строка таблицы для сообщения о тренировке."""
+    return (str(athlete), timestamp, info.training_type, info.duration,
+            info.distance, info.speed, info.calories)
+
+
+class ResultStore:
+    """Хранилище результатов в файле SQLite (или в памяти)."""
+
+    def __init__(self, path: str = ':memory:',
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        if path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def close(self) -> None:
+        """Закрыть файл хранилища."""
+        self.connection.close()
+
+    def insert_rows(self, rows: Iterable[Row]) -> int:
+        """Дописать готовые строки пачками по `batch_size` в транзакциях.
+
+        Возвращает количество записанных строк.
+        """
+        written: int = 0
+        batch: List[Row] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                with self.connection:
+                    self.connection.executemany(INSERT, batch)
+                written += len(batch)
+                batch.clear()
+        if batch:
+            with self.connection:
+                self.connection.executemany(INSERT, batch)
+            written += len(batch)
+        return written
+
+    def insert_many(self,
+                    records: Iterable[Tuple[Hashable, float, InfoMessage]],
+                    ) -> int:
+        """Дописать тройки `(athlete, timestamp, info)`."""
+        return self.insert_rows(to_row(*record) for record in records)
+
+    def insert(self, athlete: Hashable, timestamp: float,
+               info: InfoMessage) -> None:
+        """Дописать одну тренировку."""
+        with self.connection:
+            self.connection.execute(INSERT, to_row(athlete, timestamp, info))
+
+    def add_package(self, athlete: Hashable, timestamp: float,
+                    workout_type: str, data: Sequence[float]) -> InfoMessage:
+        """Рассчитать пакет, сохранить и вернуть результат."""
+        info: InfoMessage = read_package(workout_type,
+                                         data).show_training_info()
+        self.insert(athlete, timestamp, info)
+        return info
+
+    @staticmethod
+    def _where(training_type: Optional[str], athlete: Optional[Hashable],
+               start: Optional[float], end: Optional[float],
+               ) -> Tuple[str, List[object]]:
+        conditions: List[str] = []
+        parameters: List[object] = []
+        if training_type is not None:
+            conditions.append('training_type = ?')
+            parameters.append(training_type)
+        if athlete is not None:
+            conditions.append('athlete = ?')
+            parameters.append(str(athlete))
+        if start is not None:
+            conditions.append('timestamp >= ?')
+            parameters.append(start)
+        if end is not None:
+            conditions.append('timestamp < ?')
+            parameters.append(end)
+        where: str = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+        return where, parameters
+
+    def query(self, training_type: Optional[str] = None,
+              athlete: Optional[Hashable] = None,
+              start: Optional[float] = None,
+              end: Optional[float] = None,
+              ) -> Iterator[StoredTraining]:
+        """Тренировки по фильтрам в порядке времени.
+
+        `training_type` — имя класса (`'Swimming'`), интервал времени
+        `[start; end)` задаётся в секундах эпохи.
+        """
+        where, parameters = self._where(training_type, athlete, start, end)
+        cursor = self.connection.execute(
+            f'SELECT {COLUMNS} FROM trainings{where} ORDER BY timestamp',
+            parameters,
+        )
+        for athlete_id, timestamp, *fields in cursor:
+            yield StoredTraining(athlete_id, timestamp, InfoMessage(*fields))
+
+    def count(self, training_type: Optional[str] = None,
+              athlete: Optional[Hashable] = None,
+              start: Optional[float] = None,
+              end: Optional[float] = None) -> int:
+        """Количество тренировок по тем же фильтрам, что и `query`."""
+        where, parameters = self._where(training_type, athlete, start, end)
+        return self.connection.execute(
+            f'SELECT COUNT(*) FROM trainings{where}', parameters,
+        ).fetchone()[0]
+
+    def last_week(self, training_type: Optional[str] = None,
+                  athlete: Optional[Hashable] = None,
+                  now: Optional[float] = None) -> Iterator[StoredTraining]:
+        """Тренировки за последние семь дней."""
+        now = time.time() if now is None else now
+        return self.query(training_type, athlete, now - WEEK, now)
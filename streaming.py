@@ -0,0 +1,186 @@
+"""Потоковая обработка файлов с пакетами от датчиков."""
+import argparse
+import csv
+import json
+import sys
+from typing import (IO, Any, Callable, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple)
+
+from homework import InfoMessage, read_package
+
+Package = Tuple[str, List[float]]
+
+FORMATS: Tuple[str, ...] = ('ndjson', 'csv')
+OUTPUT_FORMATS: Tuple[str, ...] = ('text', 'jsonl', 'csv')
+DEFAULT_CHUNK_SIZE: int = 1000
+
+
+def parse_ndjson_line(line: str) -> Package:
+    """Разобрать строку NDJSON.
+
+    Поддерживаются записи вида `["RUN", [15000, 1, 75]]`
+    и `{"workout_type": "RUN", "data": [15000, 1, 75]}`.
+    """
+    record = json.loads(line)
+    if isinstance(record, dict):
+        return record['workout_type'], record['data']
+    workout_type, data = record
+    return workout_type, data
+
+
+def parse_csv_row(row: Sequence[str]) -> Package:
+    """Разобрать строку CSV вида `RUN,15000,1,75`."""
+    workout_type, *data = row
+    return workout_type.strip(), [float(value) for value in data]
+
+
+def iter_packages(lines: Iterable[str], fmt: str = 'ndjson',
+                  on_error: Optional[Callable[[Any, Exception], None]] = None,
+                  ) -> Iterator[Package]:
+    """Лениво прочитать пакеты из строк файла, пропуская пустые.
+
+    Если передан `on_error`, нечитаемые строки передаются в него
+    вместе с ошибкой, а чтение продолжается.
+    """
+    if fmt == 'csv':
+        records: Iterable[Any] = (row for row in csv.reader(lines) if row)
+        parse: Callable[[Any], Package] = parse_csv_row
+    elif fmt == 'ndjson':
+        records = (line for line in lines if line.strip())
+        parse = parse_ndjson_line
+    else:
+        raise ValueError(f'Неизвестный формат входных данных: {fmt!r}')
+    for record in records:
+        if on_error is None:
+            yield parse(record)
+            continue
+        try:
+            package: Package = parse(record)
+        except (ValueError, TypeError, KeyError) as error:
+            on_error(record, error)
+        else:
+            yield package
+
+
+def iter_infos(packages: Iterable[Package]) -> Iterator[InfoMessage]:
+    """Превратить пакеты в информационные сообщения."""
+    for workout_type, data in packages:
+        yield read_package(workout_type, data).show_training_info()
+
+
+def iter_messages(packages: Iterable[Package]) -> Iterator[str]:
+    """Превратить пакеты в строки отчёта."""
+    for info in iter_infos(packages):
+        yield info.get_message()
+
+
+def write_chunked(messages: Iterable[str], out: IO[str],
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  ) -> int:
+    """Записать строки в `out` блоками по `chunk_size` строк.
+
+    Возвращает количество записанных строк.
+    """
+    chunk: List[str] = []
+    written: int = 0
+    for message in messages:
+        chunk.append(message)
+        if len(chunk) >= chunk_size:
+            out.write('\n'.join(chunk) + '\n')
+            written += len(chunk)
+            chunk.clear()
+    if chunk:
+        out.write('\n'.join(chunk) + '\n')
+        written += len(chunk)
+    return written
+
+
+def write_output(infos: Iterable[InfoMessage],
+                 args: argparse.Namespace) -> None:
+    """Записать сообщения через `sinks.OutputWriter`."""
+    from sinks import OutputWriter, open_sink
+    with OutputWriter(open_sink(args.output or '-'), args.output_format,
+                      background=args.background_writer) as writer:
+        writer.write_many(infos)
+
+
+def detect_format(path: str) -> str:
+    """Определить формат по расширению файла."""
+    return 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Собрать парсер аргументов командной строки."""
+    parser = argparse.ArgumentParser(
+        description='Потоковый расчёт тренировок по файлу пакетов.',
+    )
+    parser.add_argument('path', nargs='?', default='-',
+                        help='файл NDJSON/CSV, по умолчанию stdin')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='формат входных данных')
+    parser.add_argument('--chunk-size', type=int,
+                        default=DEFAULT_CHUNK_SIZE,
+                        help='количество строк в одном блоке вывода')
+    parser.add_argument('--output', metavar='PATH',
+                        help='файл результата (.gz сжимается), '
+                             'по умолчанию stdout')
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS,
+                        default='text', help='формат результата')
+    parser.add_argument('--background-writer', action='store_true',
+                        help='писать результат в отдельном потоке')
+    parser.add_argument('--dead-letter', metavar='PATH',
+                        help='не прерываться на плохих пакетах, а писать '
+                             'их с причиной в JSONL-файл')
+    parser.add_argument('--profile', action='store_true',
+                        help='вывести в stderr время по этапам расчёта')
+    parser.add_argument('--profile-output', metavar='PATH',
+                        help='сохранить замеры в JSON или .prom файл')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Точка входа командной строки."""
+    args = build_parser().parse_args(argv)
+    fmt: str = args.format or detect_format(args.path)
+    if args.path == '-':
+        source: IO[str] = sys.stdin
+    else:
+        source = open(args.path, encoding='utf-8', newline='')
+    profiler = None
+    if args.profile or args.profile_output:
+        from profiling import Profiler
+        profiler = Profiler().install()
+    dead_letter = None
+    if args.dead_letter:
+        from sinks import FileSink
+        from validation import DeadLetter, iter_valid_infos
+        dead_letter = DeadLetter(FileSink(args.dead_letter))
+    try:
+        if dead_letter is None:
+            infos = iter_infos(iter_packages(source, fmt))
+        else:
+            infos = iter_valid_infos(
+                iter_packages(source, fmt, dead_letter.add_unreadable),
+                dead_letter,
+            )
+        if args.output or args.output_format != 'text':
+            write_output(infos, args)
+        else:
+            write_chunked((info.get_message() for info in infos),
+                          sys.stdout, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if dead_letter is not None:
+            dead_letter.close()
+        if profiler is not None:
+            profiler.uninstall()
+    if profiler is not None:
+        if args.profile_output:
+            profiler.export(args.profile_output)
+        if args.profile:
+            print(profiler.report(), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import pytest
+
+import aggregation
+import homework
+
+HOUR = 3600
+
+
+def test_totals_accumulate_and_expire():
+    aggregator = aggregation.RollingAggregator()
+    first = aggregator.add_package('anna', 'RUN', [15000, 1, 75], 0)
+    second = aggregator.add_package('anna', 'RUN', [9000, 1, 75], 1800)
+    totals = aggregator.totals('anna', 'Running', 'hour', now=1800)
+    assert totals.count == 2
+    assert totals.distance == pytest.approx(first.distance + second.distance)
+    assert totals.mean_speed == pytest.approx(
+        (first.speed + second.speed) / 2
+    )
+    later = aggregator.totals('anna', 'Running', 'hour', now=HOUR + 900)
+    assert later.count == 1, 'Старые тренировки должны выпадать из окна.'
+    assert later.calories == pytest.approx(second.calories)
+    day = aggregator.totals('anna', 'Running', 'day', now=HOUR + 900)
+    assert day.count == 2
+
+
+def test_totals_are_separate_per_athlete_and_type():
+    aggregator = aggregation.RollingAggregator()
+    aggregator.add_package('anna', 'RUN', [15000, 1, 75], 0)
+    aggregator.add_package('boris', 'SWM', [720, 1, 80, 25, 40], 0)
+    assert aggregator.totals('anna', 'Swimming', 'hour', now=0).count == 0
+    assert aggregator.totals('boris', 'Swimming', 'hour', now=0).count == 1
+    assert len(aggregator.snapshot(now=0)) == 6
+
+
+def test_late_event_goes_to_its_bucket():
+    aggregator = aggregation.RollingAggregator({'hour': (HOUR, 60)})
+    info = homework.read_package('WLK', [9000, 1, 75, 180]
+                                 ).show_training_info()
+    aggregator.add('anna', info, 1000)
+    aggregator.add('anna', info, 500)
+    aggregator.add('anna', info, 1000 - 2 * HOUR)
+    totals = aggregator.totals('anna', 'SportsWalking', 'hour', now=1000)
+    assert totals.count == 2
+    assert aggregator.totals('anna', 'SportsWalking', 'hour',
+                             now=500 + HOUR + 60).count == 1
@@ -0,0 +1,147 @@
+import random
+
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [420, 4, 20, 42]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+]
+
+
+NUMPY_MODES = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        batch.load_numpy() is None, reason='NumPy не установлен')),
+]
+
+
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+def test_compute_batch_matches_classes(use_numpy):
+    workout_types, columns = batch.packages_to_columns(PACKAGES)
+    result = batch.compute_batch(workout_types, columns, use_numpy)
+    for index, (workout_type, data) in enumerate(PACKAGES):
+        training = homework.read_package(workout_type, data)
+        assert result['distance'][index] == training.get_distance(), (
+            'Дистанция в `compute_batch` должна совпадать '
+            'с `get_distance`.'
+        )
+        assert result['speed'][index] == training.get_mean_speed(), (
+            'Скорость в `compute_batch` должна совпадать '
+            'с `get_mean_speed`.'
+        )
+        assert result['calories'][index] == training.get_spent_calories(), (
+            'Калории в `compute_batch` должны совпадать '
+            'с `get_spent_calories`.'
+        )
+
+
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+def test_compute_batch_empty(use_numpy):
+    result = batch.compute_batch([], [[] for _ in range(5)], use_numpy)
+    assert all(len(column) == 0 for column in result.values())
+
+
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+def test_compute_batch_unknown_code(use_numpy):
+    workout_types, columns = batch.packages_to_columns([('XXX', [1, 1, 1])])
+    with pytest.raises(ValueError):
+        batch.compute_batch(workout_types, columns, use_numpy)
+
+
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+@pytest.mark.parametrize('package, error', [
+    (('RUN', [15000, 0, 75]), ZeroDivisionError),
+    (('WLK', [9000, 0, 75, 180]), ZeroDivisionError),
+    (('WLK', [9000, 1, 75, 0]), ZeroDivisionError),
+    (('SWM', [720, 0, 80, 25, 40]), ZeroDivisionError),
+    (('WLK', [1e300, 1e-5, 75, 180]), OverflowError),
+])
+def test_compute_batch_raises_like_classes(use_numpy, package, error):
+    with pytest.raises(error):
+        homework.read_package(*package).show_training_info()
+    workout_types, columns = batch.packages_to_columns(
+        [('RUN', [15000, 1, 75]), package])
+    with pytest.raises(error):
+        batch.compute_batch(workout_types, columns, use_numpy)
+
+
+@pytest.mark.parametrize('package', [
+    ('SWM', [720, 1, 80]),
+    ('RUN', [15000, 1, 75, 999, 5]),
+    ('WLK', [9000, 1, 75]),
+])
+def test_packages_to_columns_checks_arity(package):
+    with pytest.raises(TypeError):
+        homework.read_package(*package)
+    with pytest.raises(TypeError):
+        batch.packages_to_columns([package])
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    ([9000, 1, 75, 180], 157.50000000000003),
+    ([420, 4, 20, 42], 168.00000000000003),
+    ([1206, 12, 6, 12], 151.20000000000002),
+])
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+def test_walking_batch_known_values(input_data, expected, use_numpy):
+    _, _, calories = batch.walking_batch(*([value] for value in input_data),
+                                         use_numpy=use_numpy)
+    assert calories == [expected]
+
+
+def random_walks(rng, count):
+    for _ in range(count):
+        height = rng.choice([rng.uniform(0.5, 250), rng.randint(1, 250)])
+        duration = rng.choice([rng.uniform(0.01, 5), rng.randint(1, 5)])
+        if rng.random() < 0.3:
+            # Скорость, чей квадрат близок к кратному росту.
+            speed = (rng.randint(1, 20) * height) ** 0.5
+            action = round(speed * duration * 1000 / 0.65)
+        else:
+            action = rng.randint(0, 100_000)
+        yield [action, duration, rng.uniform(30, 150), height]
+
+
+@pytest.mark.parametrize('use_numpy', NUMPY_MODES)
+def test_walking_batch_matches_scalar_class(use_numpy):
+    rng = random.Random(20220214)
+    packages = list(random_walks(rng, 20_000))
+    distance, speed, calories = batch.walking_batch(*zip(*packages),
+                                                    use_numpy=use_numpy)
+    for index, data in enumerate(packages):
+        training = homework.SportsWalking(*data)
+        assert (distance[index], speed[index], calories[index]) == (
+            training.get_distance(),
+            training.get_mean_speed(),
+            training.get_spent_calories(),
+        ), f'Расхождение с `SportsWalking` для пакета {data}'
+
+
+@pytest.mark.skipif(batch.load_numpy() is None, reason='NumPy не установлен')
+def test_numpy_kernels_match_scalar_classes():
+    rng = random.Random(20220215)
+    packages = [('WLK', data) for data in random_walks(rng, 20_000)]
+    for _ in range(20_000):
+        action = rng.randint(0, 100_000)
+        duration = rng.choice([rng.uniform(0.01, 5), rng.randint(1, 5)])
+        weight = rng.uniform(30, 150)
+        packages.append(('RUN', [action, duration, weight]))
+        packages.append(('SWM', [action, duration, weight,
+                                 rng.randint(10, 50), rng.randint(1, 80)]))
+    workout_types, columns = batch.packages_to_columns(packages)
+    result = batch.compute_batch(workout_types, columns, use_numpy=True)
+    for index, (workout_type, data) in enumerate(packages):
+        training = homework.read_package(workout_type, data)
+        assert (result['distance'][index], result['speed'][index],
+                result['calories'][index]) == (
+            training.get_distance(),
+            training.get_mean_speed(),
+            training.get_spent_calories(),
+        ), f'Расхождение с `{type(training).__name__}` для пакета {data}'
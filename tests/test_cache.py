@@ -0,0 +1,49 @@
+import pytest
+
+import cache
+import homework
+
+
+def test_lru_cache_counters():
+    lru = cache.LRUCache(maxsize=2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1
+    lru.put('c', 3)
+    assert lru.get('b') is None, 'Вытесняться должен самый старый ключ.'
+    assert lru.get('a') == 1
+    assert lru.stats() == {'hits': 2, 'misses': 1, 'evictions': 1,
+                           'size': 2, 'maxsize': 2}
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_cached_calculator_matches(workout_type, data):
+    calculator = cache.CachedCalculator(maxsize=4)
+    expected = homework.read_package(workout_type, data).show_training_info()
+    assert calculator.info(workout_type, data) == expected
+    assert calculator.info(workout_type, list(data)) == expected
+    assert calculator.stats()['hits'] == 1
+    assert calculator.stats()['misses'] == 1
+
+
+def test_cached_metrics_computed_once(monkeypatch):
+    calls = []
+    original = homework.Training.get_distance
+
+    def counting_get_distance(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(homework.Training, 'get_distance',
+                        counting_get_distance)
+    training = cache.read_cached_package('RUN', [9000, 1, 75])
+    assert type(training).__name__ == 'Running'
+    assert isinstance(training, homework.Running)
+    training.show_training_info()
+    assert len(calls) == 1, (
+        'Дистанция должна считаться один раз на объект тренировки.'
+    )
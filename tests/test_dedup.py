@@ -0,0 +1,74 @@
+import dedup
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = dedup.BloomFilter(capacity=1000, error_rate=0.01)
+    for key in range(1000):
+        bloom.add(('device', key))
+    assert all(('device', key) in bloom for key in range(1000))
+    false_positives = sum(('other', key) in bloom for key in range(1000))
+    assert false_positives < 50
+
+
+def test_deduplicator_counts_repeats():
+    index = dedup.Deduplicator(capacity=100, exact_size=10)
+    assert not index.seen(('a', 1))
+    assert index.seen(('a', 1))
+    assert not index.seen(('b', 1))
+    assert (index.unique, index.duplicates) == (2, 1)
+
+
+def test_deduplicator_rotates_generations():
+    index = dedup.Deduplicator(capacity=10, exact_size=1000)
+    for seq in range(25):
+        index.seen(('a', seq))
+    assert index.seen(('a', 24))
+    assert index.current.count <= 10
+
+
+def test_deduplicator_exact_set_outlives_bloom_generations():
+    index = dedup.Deduplicator(capacity=10, exact_size=1000)
+    new = [seq for seq in range(25) if not index.seen(('a', seq))]
+    assert len(new) > 10
+    uncertain = index.uncertain
+    assert all(index.seen(('a', seq)) for seq in new)
+    assert index.uncertain == uncertain
+
+
+def test_deduplicator_bloom_remembers_beyond_exact_set():
+    index = dedup.Deduplicator(capacity=1000, error_rate=0.001, exact_size=5)
+    for seq in range(100):
+        index.seen(('a', seq))
+    assert index.seen(('a', 0))
+    assert index.uncertain >= 1
+    assert len(index.exact) == 5
+
+
+def test_reorder_buffer_releases_in_time_order():
+    buffer = dedup.ReorderBuffer(window=2)
+    released = []
+    for timestamp in (1, 3, 2, 6, 5, 10):
+        released.extend(buffer.push(timestamp, timestamp))
+    assert released == [1, 2, 3, 5, 6]
+    assert buffer.reordered == 2
+    assert buffer.push(4, 4) == [4]
+    assert buffer.late == 1
+    assert buffer.flush() == [10]
+
+
+def test_stream_ingestor():
+    ingestor = dedup.StreamIngestor(window=1)
+    packages = [
+        ('dev1', 1, 10.0, 'RUN', [15000, 1, 75]),
+        ('dev1', 1, 10.0, 'RUN', [15000, 1, 75]),
+        ('dev2', 7, 9.5, 'WLK', [9000, 1, 75, 180]),
+        ('dev1', 2, 12.0, 'SWM', [720, 1, 80, 25, 40]),
+    ]
+    released = ingestor.push_many(packages) + ingestor.flush()
+    assert [workout_type for workout_type, _ in released] == [
+        'WLK', 'RUN', 'SWM',
+    ]
+    stats = ingestor.stats()
+    assert stats['duplicates'] == 1
+    assert stats['reordered'] == 1
+    assert stats['buffered'] == 0
@@ -0,0 +1,51 @@
+import io
+import socket
+
+import formatting
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def make_infos():
+    return [homework.read_package(*package).show_training_info()
+            for package in PACKAGES]
+
+
+def test_format_message_matches_get_message():
+    for info in make_infos():
+        assert formatting.format_message(info) == info.get_message()
+
+
+def test_format_messages_to_string():
+    infos = make_infos()
+    expected = ''.join(info.get_message() + '\n' for info in infos)
+    assert formatting.format_messages(infos) == expected
+    assert formatting.format_messages(infos, buffer_size=1) == expected
+
+
+def test_format_messages_to_streams():
+    infos = make_infos()
+    expected = ''.join(info.get_message() + '\n' for info in infos)
+    text_out = io.StringIO()
+    binary_out = io.BytesIO()
+    formatting.format_messages(infos, text_out, buffer_size=10)
+    formatting.format_messages(infos, binary_out)
+    assert text_out.getvalue() == expected
+    assert binary_out.getvalue() == expected.encode('utf-8')
+
+
+def test_format_messages_to_socket():
+    infos = make_infos()
+    left, right = socket.socketpair()
+    with left, right:
+        formatting.format_messages(infos, left)
+        left.shutdown(socket.SHUT_WR)
+        received = b''.join(iter(lambda: right.recv(4096), b''))
+    assert received.decode('utf-8').splitlines() == [
+        info.get_message() for info in infos
+    ]
@@ -0,0 +1,37 @@
+import pytest
+
+import homework
+import lazy
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_lazy_message_matches(workout_type, data):
+    training = homework.read_package(workout_type, data)
+    expected = training.show_training_info()
+    message = lazy.lazy_training_info(training)
+    assert message.get_message() == expected.get_message()
+    assert message.to_info() == expected
+
+
+def test_lazy_fields_computed_on_demand(monkeypatch):
+    training = homework.read_package('RUN', [9000, 1, 75])
+    calls = []
+
+    def fail():
+        raise AssertionError('Дистанция не должна считаться.')
+
+    def calories():
+        calls.append(1)
+        return 1.0
+
+    monkeypatch.setattr(training, 'get_distance', fail)
+    monkeypatch.setattr(training, 'get_mean_speed', fail)
+    monkeypatch.setattr(training, 'get_spent_calories', calories)
+    message = lazy.LazyInfoMessage(training)
+    assert message.calories == 1.0
+    assert message.calories == 1.0
+    assert calls == [1], 'Калории должны считаться один раз.'
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+import batch
+import homework
+import packed
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+@pytest.fixture
+def packed_path(tmp_path):
+    path = str(tmp_path / 'packages.bin')
+    assert packed.write_packed_file(path, PACKAGES) == len(PACKAGES)
+    return path
+
+
+def test_reader_yields_packages(packed_path):
+    with packed.PackedReader(packed_path) as reader:
+        assert len(reader) == len(PACKAGES)
+        assert list(reader) == PACKAGES
+        assert reader.workout_types() == ['SWM', 'RUN', 'WLK']
+
+
+def test_reader_columns_feed_batch(packed_path):
+    with packed.PackedReader(packed_path) as reader:
+        columns = reader.columns()
+        result = batch.compute_batch(reader.workout_types(), columns)
+        for column in columns:
+            column.release()
+    for index, package in enumerate(PACKAGES):
+        training = homework.read_package(*package)
+        assert result['calories'][index] == training.get_spent_calories()
+
+
+def test_reader_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a packed file')
+    with pytest.raises(ValueError):
+        packed.PackedReader(str(path))
+
+
+def test_pack_package_rejects_unknown_code():
+    with pytest.raises(ValueError):
+        packed.write_packed(io.BytesIO(), [('XXX', [1, 1, 1])])
+
+
+@pytest.mark.parametrize('package', [
+    ('RUN', [1000, 1]),
+    ('RUN', [15000, 1, 75, 180, 9]),
+    ('SWM', [720, 1, 80]),
+])
+def test_pack_package_checks_arity(package):
+    with pytest.raises(TypeError):
+        homework.read_package(*package)
+    with pytest.raises(TypeError):
+        packed.pack_package(*package)
@@ -0,0 +1,44 @@
+import pytest
+
+import homework
+import parallel
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+] * 5
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 100])
+def test_run_parallel_keeps_order(chunk_size):
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    result = list(parallel.run_parallel(PACKAGES, workers=2,
+                                        chunk_size=chunk_size))
+    assert result == expected, (
+        '`run_parallel` должен возвращать сообщения в порядке пакетов.'
+    )
+
+
+def test_run_parallel_reads_input_lazily():
+    consumed = []
+
+    def packages():
+        for index, package in enumerate(PACKAGES * 100):
+            consumed.append(index)
+            yield package
+
+    results = parallel.run_parallel(packages(), workers=2, chunk_size=3,
+                                    window=2)
+    assert next(results) == homework.read_package(
+        *PACKAGES[0]).show_training_info()
+    assert len(consumed) <= 3 * 3, (
+        'Вперёд должно читаться не больше `window` пачек.'
+    )
+    results.close()
+
+
+def test_iter_chunks():
+    chunks = list(parallel.iter_chunks(range(5), 2))
+    assert chunks == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from benchmarks import suite
+
+BASE = {'read_package': {'1000': {'throughput': 100.0,
+                                  'peak_bytes': 1000}}}
+
+
+@pytest.mark.parametrize('entry, expected', [
+    ({'throughput': 90.0, 'peak_bytes': 1000}, 0),
+    ({'throughput': 70.0, 'peak_bytes': 1000}, 1),
+    ({'throughput': 100.0, 'peak_bytes': 1500}, 1),
+    ({'throughput': 10.0, 'peak_bytes': 5000}, 2),
+])
+def test_compare_detects_regressions(entry, expected):
+    results = {'read_package': {'1000': entry}}
+    assert len(suite.compare(results, BASE, threshold=0.25)) == expected
+
+
+@pytest.mark.skipif('PERF_THRESHOLD' not in os.environ,
+                    reason='задайте PERF_THRESHOLD для замеров скорости')
+def test_no_regressions_against_baseline():
+    sizes = [1000, 10_000]
+    results = suite.measure(sizes, repeat=3)
+    regressions = suite.compare(results, suite.load_baseline(),
+                                float(os.environ['PERF_THRESHOLD']))
+    assert not regressions, '\n'.join(regressions)
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+import pipeline
+from benchmarks.common import synthetic_packages
+from homework import read_package
+
+
+def make_input(packages):
+    return ''.join(f'{workout_type},{",".join(map(str, data))}\n'
+                   for workout_type, data in packages)
+
+
+@pytest.mark.parametrize('parsers, computers, chunk_size', [
+    (1, 1, 7),
+    (3, 2, 5),
+    (2, 4, 1000),
+])
+def test_pipeline_matches_sequential(parsers, computers, chunk_size):
+    packages = synthetic_packages(200)
+    expected = ''.join(
+        read_package(workout_type, [float(value) for value in data])
+        .show_training_info().get_message() + '\n'
+        for workout_type, data in packages
+    )
+    out = io.StringIO()
+    pipeline.Pipeline(parsers, computers, chunk_size, queue_size=2,
+                      fmt='csv').run(io.StringIO(make_input(packages)), out)
+    assert out.getvalue() == expected
+
+
+def test_pipeline_reports_errors():
+    out = io.StringIO()
+    with pytest.raises(ValueError):
+        pipeline.Pipeline(chunk_size=1, fmt='csv').run(
+            io.StringIO('RUN,15000,1,75\nXXX,1,1,1\nRUN,15000,1,75\n'), out,
+        )
+
+
+@pytest.mark.parametrize('row', [
+    'SWM,720,1,80',
+    'RUN,15000,1,75,999,5',
+    'WLK,9000,1,75',
+])
+def test_pipeline_rejects_wrong_arity(row):
+    with pytest.raises(TypeError):
+        pipeline.Pipeline(fmt='csv').run(io.StringIO(row + '\n'),
+                                         io.StringIO())
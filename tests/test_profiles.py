@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+import homework
+import profiles
+
+
+def random_sessions(rng, count):
+    for _ in range(count):
+        yield rng.randint(0, 60_000), rng.choice([rng.uniform(0.05, 5),
+                                                  rng.randint(1, 5)])
+
+
+@pytest.mark.parametrize('workout_type, athlete', [
+    ('RUN', [75]),
+    ('RUN', [63.7]),
+    ('WLK', [75, 180]),
+    ('WLK', [48.3, 0.9]),
+    ('SWM', [80, None, 25, 40]),
+    ('SWM', [91.1, None, 50, 13]),
+])
+def test_profile_matches_classes(workout_type, athlete):
+    weight, height, *pool = athlete + [None] * (4 - len(athlete))
+    profile = profiles.AthleteProfile(weight, height, *pool)
+    extra = {'RUN': [], 'WLK': [height], 'SWM': pool}[workout_type]
+    rng = random.Random(workout_type)
+    for action, duration in random_sessions(rng, 5000):
+        expected = homework.read_package(
+            workout_type, [action, duration, weight, *extra]
+        ).show_training_info()
+        assert profile.compute(workout_type, action, duration) == expected
+
+
+def test_profile_index():
+    index = profiles.ProfileIndex()
+    index.add('anna', 75, height=180)
+    assert 'anna' in index
+    result = index.compute('anna', 'WLK', 9000, 1)
+    assert result.calories == 157.50000000000003
+    with pytest.raises(KeyError):
+        index.compute('boris', 'RUN', 9000, 1)
+    with pytest.raises(ValueError):
+        index.compute('anna', 'SWM', 720, 1)
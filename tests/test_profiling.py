@@ -0,0 +1,56 @@
+import json
+
+import homework
+import profiling
+import streaming
+from conftest import Capturing
+
+
+def run_main(workout_type, data):
+    training = homework.read_package(workout_type, data)
+    homework.main(training)
+
+
+def test_profiler_counts_stages():
+    with Capturing():
+        _, profiler = profiling.profile(run_main, 'RUN', [15000, 1, 75])
+    counted = {key: stats.count for key, stats in profiler.stats.items()}
+    assert counted[('read_package', 'Running')] == 1
+    assert counted[('construct', 'Running')] == 1
+    assert counted[('get_spent_calories', 'Running')] == 1
+    assert counted[('show_training_info', 'Running')] == 1
+    assert counted[('get_message', 'Running')] == 1
+    assert counted[('print', profiling.ALL_TYPES)] == 1
+
+
+def test_uninstall_restores_originals():
+    originals = (homework.read_package, streaming.read_package,
+                 dict(homework.WORKOUT_FACTORIES),
+                 homework.Running.__dict__['get_spent_calories'],
+                 homework.InfoMessage.get_message)
+    with profiling.Profiler():
+        assert homework.read_package is not originals[0]
+        assert streaming.read_package is not originals[1]
+    assert (homework.read_package, streaming.read_package,
+            dict(homework.WORKOUT_FACTORIES),
+            homework.Running.__dict__['get_spent_calories'],
+            homework.InfoMessage.get_message) == originals
+    assert 'print' not in vars(homework)
+
+
+def test_profiler_exports(tmp_path):
+    profiler = profiling.Profiler(buckets=(0.5,))
+    profiler.record('get_message', 'Swimming', 0.25)
+    profiler.record('get_message', 'Swimming', 1.0)
+    json_path = tmp_path / 'profile.json'
+    prom_path = tmp_path / 'profile.prom'
+    profiler.export(str(json_path))
+    profiler.export(str(prom_path))
+    stage = json.loads(json_path.read_text(encoding='utf-8'))['stages'][0]
+    assert stage['count'] == 2
+    assert stage['histogram'] == [1, 1]
+    prometheus = prom_path.read_text(encoding='utf-8')
+    assert ('training_stage_seconds_bucket{stage="get_message",'
+            'workout="Swimming",le="+Inf"} 2') in prometheus
+    assert ('training_stage_seconds_count{stage="get_message",'
+            'workout="Swimming"} 2') in prometheus
@@ -0,0 +1,121 @@
+import asyncio
+import io
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import quick
+import server
+from conftest import Capturing
+
+RUNNING = (
+    'Тип тренировки: Running; '
+    'Длительность: 1.000 ч.; '
+    'Дистанция: 9.750 км; '
+    'Ср. скорость: 9.750 км/ч; '
+    'Потрачено ккал: 699.750.'
+)
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    path = str(tmp_path / 'worker.sock')
+    loop = asyncio.new_event_loop()
+    training_server = server.TrainingServer()
+    listener = loop.run_until_complete(training_server.start_unix(path))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv(quick.SOCKET_ENV, path)
+    yield path
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    listener.close()
+    loop.run_until_complete(listener.wait_closed())
+    loop.run_until_complete(training_server.close())
+    loop.close()
+
+
+def test_to_ndjson():
+    assert quick.to_ndjson('RUN', ['15000', 1, 75]) == (
+        '["RUN", [15000.0, 1.0, 75.0]]'
+    )
+    with pytest.raises(ValueError):
+        quick.to_ndjson('R"N', [1])
+
+
+def test_main_computes_locally(tmp_path, monkeypatch):
+    monkeypatch.setenv(quick.SOCKET_ENV, str(tmp_path / 'missing.sock'))
+    with Capturing() as output:
+        status = quick.main(['RUN', '15000', '1', '75'])
+    assert status == 0
+    assert output == [RUNNING]
+
+
+def test_main_uses_worker(worker):
+    assert quick.ask_worker(worker, ['["RUN", [15000, 1, 75]]']) == [
+        RUNNING
+    ]
+    with Capturing() as output:
+        status = quick.main(['RUN', '15000', '1', '75'])
+    assert status == 0
+    assert output == [RUNNING]
+
+
+def test_bad_values_are_reported_per_line(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv(quick.SOCKET_ENV, str(tmp_path / 'missing.sock'))
+    assert quick.main(['RUN', 'abc', '1', '75']) == 1
+    assert capsys.readouterr().err.startswith(quick.ERROR_PREFIX)
+    monkeypatch.setattr('sys.stdin',
+                        io.StringIO('RUN,15000,1,75\nWLK,x,1,2,3\n'
+                                    '["RUN", [15000, 1, 75]]\n'))
+    assert quick.main([]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [RUNNING, RUNNING]
+    assert len(captured.err.splitlines()) == 1
+
+
+def test_socket_path_uses_runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv(quick.SOCKET_ENV, raising=False)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert quick.socket_path() == str(tmp_path / 'training-worker.sock')
+
+
+def test_foreign_paths_are_not_trusted(tmp_path):
+    path = str(tmp_path / 'worker.sock')
+    with open(path, 'w'):
+        pass
+    assert not quick.is_own_socket(path)
+    assert quick.ask_worker(path, ['["RUN", [15000, 1, 75]]']) is None
+    with pytest.raises(PermissionError):
+        quick.serve(path)
+    assert os.path.exists(path)
+
+
+def test_hung_worker_falls_back_to_local(tmp_path, monkeypatch):
+    path = str(tmp_path / 'hung.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+        listener.listen()
+        monkeypatch.setenv(quick.SOCKET_ENV, path)
+        monkeypatch.setattr(quick, 'WORKER_TIMEOUT', 0.1)
+        assert quick.ask_worker(path, ['["RUN", [15000, 1, 75]]']) is None
+        with Capturing() as output:
+            assert quick.main(['RUN', '15000', '1', '75']) == 0
+    assert output == [RUNNING]
+
+
+def test_local_path_skips_heavy_modules():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', 'quick.py', '--local',
+         'RUN', '15000', '1', '75'],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(quick.__file__)),
+    )
+    assert result.stdout.strip() == RUNNING
+    imported = {line.split('|')[-1].strip()
+                for line in result.stderr.splitlines() if '|' in line}
+    assert not imported & {'streaming', 'argparse', 'csv', 'json', 'socket'}
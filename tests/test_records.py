@@ -0,0 +1,39 @@
+import pytest
+
+import homework
+import records
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+@pytest.mark.parametrize('workout_type, data', PACKAGES)
+def test_slotted_training_matches(workout_type, data):
+    training = homework.read_package(workout_type, data)
+    slotted = records.read_slotted_package(workout_type, data)
+    assert not hasattr(slotted, '__dict__'), (
+        'Экземпляры slotted-классов не должны иметь `__dict__`.'
+    )
+    assert type(slotted).__name__ == type(training).__name__
+    info = slotted.show_training_info()
+    assert not hasattr(info, '__dict__')
+    assert info.get_message() == training.show_training_info().get_message()
+
+
+def test_training_columns():
+    columns = records.TrainingColumns()
+    columns.extend(PACKAGES)
+    assert len(columns) == len(PACKAGES)
+    assert [columns.package(i) for i in range(len(columns))] == PACKAGES
+    computed = columns.compute()
+    for index, training in enumerate(columns):
+        assert computed['calories'][index] == training.get_spent_calories()
+
+
+def test_training_columns_rejects_bad_arity():
+    columns = records.TrainingColumns()
+    with pytest.raises(TypeError):
+        columns.append('RUN', [1, 2])
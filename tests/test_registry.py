@@ -0,0 +1,64 @@
+import pytest
+
+import homework
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_factory_matches_constructor(workout_type, data):
+    cls = homework.WORKOUT_TYPES[workout_type]
+    training = homework.read_package(workout_type, data)
+    assert type(training) is cls
+    assert vars(training) == vars(cls(*data)), (
+        'Фабрика должна заполнять те же атрибуты, что и `__init__`.'
+    )
+
+
+def test_read_package_unknown_code():
+    with pytest.raises(ValueError, match='XXX'):
+        homework.read_package('XXX', [1, 1, 1])
+
+
+def test_read_package_wrong_arity():
+    with pytest.raises(TypeError):
+        homework.read_package('RUN', [1, 1])
+
+
+def test_register_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, 'WORKOUT_FACTORIES',
+                        dict(homework.WORKOUT_FACTORIES))
+    monkeypatch.setattr(homework, 'WORKOUT_FIELDS',
+                        dict(homework.WORKOUT_FIELDS))
+
+    @homework.register_workout('JOG')
+    class Jogging(homework.Running):
+        LEN_STEP = 0.7
+
+    training = homework.read_package('JOG', [1000, 1, 70])
+    assert isinstance(training, Jogging)
+    assert training.get_distance() == 1000 * 0.7 / 1000
+
+
+def test_custom_init_is_not_bypassed(monkeypatch):
+    for name in ('WORKOUT_TYPES', 'WORKOUT_FACTORIES', 'WORKOUT_FIELDS'):
+        monkeypatch.setattr(homework, name, dict(getattr(homework, name)))
+
+    @homework.register_workout('JOG')
+    class Jogging(homework.Running):
+        def __init__(self, action, duration, weight):
+            super().__init__(action, duration / 60, weight)
+
+    assert homework.WORKOUT_FACTORIES['JOG'] is Jogging
+    training = homework.read_package('JOG', [1000, 30, 70])
+    assert training.duration == 0.5
+
+
+def test_register_workout_leaves_no_trace():
+    for registry in (homework.WORKOUT_TYPES, homework.WORKOUT_FACTORIES,
+                     homework.WORKOUT_FIELDS):
+        assert 'JOG' not in registry
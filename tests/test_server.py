@@ -0,0 +1,42 @@
+import asyncio
+
+import server
+
+REQUESTS = (
+    b'["SWM", [720, 1, 80, 25, 40]]\n'
+    b'["XXX", [1, 1, 1]]\n'
+    b'not json\n'
+    b'["WLK", [9000, 1, 75, 180]]\n'
+)
+
+
+async def exchange(payload):
+    training_server = server.TrainingServer(queue_size=2, batch_size=2)
+    listener = await training_server.start_tcp('127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(payload)
+        writer.write_eof()
+        lines = [line.decode('utf-8').rstrip('\n') async for line in reader]
+        writer.close()
+    finally:
+        listener.close()
+        await listener.wait_closed()
+        await training_server.close()
+    return lines
+
+
+def test_server_replies_in_order():
+    lines = asyncio.run(exchange(REQUESTS))
+    assert len(lines) == 4
+    assert lines[0] == (
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.'
+    )
+    assert lines[1].startswith(server.ERROR_PREFIX)
+    assert lines[2].startswith(server.ERROR_PREFIX)
+    assert lines[3].startswith('Тип тренировки: SportsWalking;')
@@ -0,0 +1,136 @@
+import csv
+import gzip
+import io
+import json
+import time
+
+import pytest
+
+import homework
+import sinks
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def make_infos():
+    return [homework.read_package(*package).show_training_info()
+            for package in PACKAGES]
+
+
+@pytest.mark.parametrize('background', [False, True])
+def test_text_output_matches_get_message(background):
+    sink = sinks.MemorySink()
+    with sinks.OutputWriter(sink, buffer_size=1,
+                            background=background) as writer:
+        writer.write_many(make_infos())
+    assert sink.getvalue().splitlines() == [
+        info.get_message() for info in make_infos()
+    ]
+    assert len(sink.chunks) == len(PACKAGES), (
+        'При маленьком буфере каждое сообщение уходит отдельным блоком.'
+    )
+
+
+def test_buffer_collects_small_writes():
+    sink = sinks.MemorySink()
+    writer = sinks.OutputWriter(sink, flush_interval=3600)
+    writer.write_many(make_infos())
+    assert sink.chunks == []
+    writer.close()
+    assert len(sink.chunks) == 1
+
+
+class RecordingSink(sinks.MemorySink):
+
+    def __init__(self, fail=False):
+        super().__init__()
+        self.fail = fail
+        self.flushes = 0
+        self.closed = False
+
+    def write(self, text):
+        if self.fail:
+            raise OSError('диск заполнен')
+        super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize('background', [False, True])
+def test_close_releases_sink_after_write_error(background):
+    sink = RecordingSink(fail=True)
+    writer = sinks.OutputWriter(sink, background=background)
+    writer.write_many(make_infos())
+    with pytest.raises(OSError):
+        writer.close()
+    assert sink.closed
+    assert writer._thread is None
+
+
+def test_interval_flush_reaches_sink():
+    sink = RecordingSink()
+    with sinks.OutputWriter(sink, flush_interval=0) as writer:
+        writer.write_many(make_infos())
+    assert sink.flushes == len(PACKAGES)
+
+
+def test_background_flushes_stale_buffer():
+    sink = RecordingSink()
+    writer = sinks.OutputWriter(sink, flush_interval=0.05, background=True)
+    writer.write(make_infos()[0])
+    deadline = time.monotonic() + 5
+    while not sink.flushes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sink.getvalue() == make_infos()[0].get_message() + '\n'
+    assert sink.flushes
+    writer.close()
+
+
+def test_jsonl_and_csv_keep_exact_values():
+    infos = make_infos()
+    jsonl_sink = sinks.MemorySink()
+    csv_sink = sinks.MemorySink()
+    with sinks.OutputWriter(jsonl_sink, 'jsonl') as writer:
+        writer.write_many(infos)
+    with sinks.OutputWriter(csv_sink, 'csv') as writer:
+        writer.write_many(infos)
+    records = [json.loads(line)
+               for line in jsonl_sink.getvalue().splitlines()]
+    rows = list(csv.DictReader(io.StringIO(csv_sink.getvalue())))
+    for info, record, row in zip(infos, records, rows):
+        assert homework.InfoMessage(**record) == info
+        assert float(row['calories']) == info.calories
+        assert row['training_type'] == info.training_type
+
+
+def test_gzip_sink(tmp_path):
+    path = str(tmp_path / 'out.txt.gz')
+    with sinks.OutputWriter(sinks.open_sink(path)) as writer:
+        writer.write_many(make_infos())
+    with gzip.open(path, 'rt', encoding='utf-8') as source:
+        assert len(source.read().splitlines()) == len(PACKAGES)
+
+
+def test_rotating_shards(tmp_path):
+    sink = sinks.RotatingShardSink(str(tmp_path), suffix='.csv',
+                                   max_bytes=100)
+    with sinks.OutputWriter(sink, 'csv', buffer_size=1) as writer:
+        writer.write_many(make_infos() * 3)
+    assert len(sink.paths) > 1
+    rows = 0
+    for path in sink.paths:
+        with open(path, encoding='utf-8') as source:
+            lines = source.read().splitlines()
+        assert lines[0] == sinks.HEADERS['csv'].strip(), (
+            'Каждый шард CSV должен начинаться с заголовка.'
+        )
+        rows += len(lines) - 1
+    assert rows == 3 * len(PACKAGES)
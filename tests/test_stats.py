@@ -0,0 +1,52 @@
+import random
+import statistics
+
+import pytest
+
+import stats
+from benchmarks.common import synthetic_packages
+
+
+def test_quantile_sketch_relative_error():
+    rng = random.Random(1)
+    values = [rng.lognormvariate(0, 2) * rng.choice([-1, 1])
+              for _ in range(20_000)] + [0.0] * 100
+    sketch = stats.QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    ordered = sorted(values)
+    for share in (0.01, 0.25, 0.5, 0.9, 0.99):
+        exact = ordered[int(share * (len(ordered) - 1))]
+        assert sketch.quantile(share) == pytest.approx(exact, rel=0.011,
+                                                       abs=1e-12)
+
+
+def test_metric_stats_merge_equals_single_pass():
+    rng = random.Random(2)
+    values = [rng.uniform(-50, 500) for _ in range(5000)]
+    whole = stats.MetricStats()
+    left, right = stats.MetricStats(), stats.MetricStats()
+    for index, value in enumerate(values):
+        whole.add(value)
+        (left if index % 3 else right).add(value)
+    left.merge(right)
+    assert left.count == whole.count == len(values)
+    assert left.minimum == min(values) and left.maximum == max(values)
+    assert left.mean == pytest.approx(statistics.fmean(values))
+    assert left.variance == pytest.approx(statistics.variance(values))
+    assert left.sketch.buckets() == whole.sketch.buckets()
+    assert sum(count for _, _, count in left.histogram(7)) == len(values)
+
+
+def test_training_stats_report():
+    shards = [stats.TrainingStats() for _ in range(2)]
+    for index, package in enumerate(synthetic_packages(300)):
+        shards[index % 2].add_package(*package)
+    shards[0].merge(shards[1])
+    total = sum(metrics['calories'].count
+                for metrics in shards[0].metrics.values())
+    assert total == 300
+    report = shards[0].report(bins=3)
+    for training_type in ('Running', 'SportsWalking', 'Swimming'):
+        assert training_type in report
+    assert 'p99' in report.splitlines()[0]
@@ -0,0 +1,44 @@
+import homework
+import store
+from benchmarks.common import synthetic_packages
+
+NOW = 1_700_000_000.0
+DAY = 24 * 60 * 60
+
+
+def fill(result_store, count=300):
+    records = []
+    for index, (workout_type, data) in enumerate(synthetic_packages(count)):
+        info = homework.read_package(workout_type, data).show_training_info()
+        records.append((f'athlete-{index % 4}', NOW - index * DAY / 10, info))
+    assert result_store.insert_many(records) == count
+    return records
+
+
+def test_query_without_recomputation(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    with store.ResultStore(path, batch_size=64) as result_store:
+        records = fill(result_store)
+    with store.ResultStore(path) as result_store:
+        assert len(result_store) == len(records)
+        found = list(result_store.last_week('Swimming', now=NOW + 1))
+        expected = [record for record in records
+                    if record[2].training_type == 'Swimming'
+                    and NOW + 1 - store.WEEK <= record[1] < NOW + 1]
+        assert found
+        assert sorted(found) == sorted(store.StoredTraining(*record)
+                                       for record in expected)
+        assert [item.timestamp for item in found] == sorted(
+            item.timestamp for item in found)
+
+
+def test_filters_and_add_package():
+    result_store = store.ResultStore()
+    records = fill(result_store, 40)
+    assert result_store.count(athlete='athlete-1') == 10
+    assert result_store.count(start=NOW - DAY, end=NOW) == 10
+    info = result_store.add_package(7, NOW + DAY, 'WLK', [9000, 1, 75, 180])
+    (stored,) = result_store.query(athlete=7)
+    assert stored == ('7', NOW + DAY, info)
+    assert stored.info.get_message() == info.get_message()
+    assert result_store.count() == len(records) + 1
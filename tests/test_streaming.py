@@ -0,0 +1,74 @@
+import io
+
+import pytest
+
+import streaming
+from conftest import Capturing
+
+EXPECTED = [
+    'Тип тренировки: Swimming; '
+    'Длительность: 1.000 ч.; '
+    'Дистанция: 0.994 км; '
+    'Ср. скорость: 1.000 км/ч; '
+    'Потрачено ккал: 336.000.',
+    'Тип тренировки: Running; '
+    'Длительность: 12.000 ч.; '
+    'Дистанция: 0.784 км; '
+    'Ср. скорость: 0.065 км/ч; '
+    'Потрачено ккал: -81.320.',
+    'Тип тренировки: SportsWalking; '
+    'Длительность: 1.000 ч.; '
+    'Дистанция: 5.850 км; '
+    'Ср. скорость: 5.850 км/ч; '
+    'Потрачено ккал: 157.500.',
+]
+
+NDJSON = (
+    '["SWM", [720, 1, 80, 25, 40]]\n'
+    '\n'
+    '{"workout_type": "RUN", "data": [1206, 12, 6]}\n'
+    '["WLK", [9000, 1, 75, 180]]\n'
+)
+CSV = 'SWM,720,1,80,25,40\nRUN,1206,12,6\nWLK,9000,1,75,180\n'
+
+
+@pytest.mark.parametrize('text, fmt', [
+    (NDJSON, 'ndjson'),
+    (CSV, 'csv'),
+])
+def test_iter_messages(text, fmt):
+    packages = streaming.iter_packages(io.StringIO(text), fmt)
+    assert list(streaming.iter_messages(packages)) == EXPECTED
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+def test_write_chunked(chunk_size):
+    out = io.StringIO()
+    written = streaming.write_chunked(EXPECTED, out, chunk_size)
+    assert written == len(EXPECTED)
+    assert out.getvalue().splitlines() == EXPECTED
+
+
+def test_cli_reads_file(tmp_path):
+    path = tmp_path / 'packages.csv'
+    path.write_text(CSV, encoding='utf-8')
+    with Capturing() as output:
+        streaming.main([str(path), '--chunk-size', '2'])
+    assert output == EXPECTED
+
+
+def test_cli_dead_letter(tmp_path):
+    path = tmp_path / 'packages.ndjson'
+    dead_letter = tmp_path / 'rejects.jsonl'
+    path.write_text(NDJSON + '["RUN", [1206, 0, 6]]\nnot json\n'
+                    '[["RUN"], [1, 2, 3]]\n'
+                    '["RUN", [1' + '0' * 400 + ', 1, 75]]\n'
+                    '["WLK", [1e300, 1e-5, 75, 180]]\n'
+                    '["RUN", [1206, 12, 6]]\n',
+                    encoding='utf-8')
+    with Capturing() as output:
+        streaming.main([str(path), '--dead-letter', str(dead_letter)])
+    assert output == EXPECTED + [EXPECTED[1]]
+    rejects = dead_letter.read_text(encoding='utf-8').splitlines()
+    assert len(rejects) == 5
+    assert 'OverflowError' in rejects[-1]
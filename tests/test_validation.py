@@ -0,0 +1,96 @@
+import math
+
+import pytest
+
+import batch
+import homework
+import sinks
+import validation
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1.5, 75, 180]),
+])
+def test_valid_packages(workout_type, data):
+    assert validation.validate_package(workout_type, data) is None
+
+
+@pytest.mark.parametrize('workout_type, data, field', [
+    ('XXX', [1, 1, 1], 'код'),
+    ('RUN', [1, 1], 'ожидается 3'),
+    ('RUN', [1, 0, 75], 'duration'),
+    ('RUN', [1, -1, 75], 'duration'),
+    ('WLK', [1, 1, 75, 0], 'height'),
+    ('SWM', [1, 1, '80', 25, 40], 'weight'),
+    ('SWM', [1, 1, 80, math.nan, 40], 'length_pool'),
+    ('RUN', [True, 1, 75], 'action'),
+    ('RUN', 'abc', 'списком'),
+    (['RUN'], [1, 2, 3], 'код'),
+    ('RUN', [10 ** 400, 1, 75], 'action'),
+])
+def test_invalid_packages(workout_type, data, field):
+    reason = validation.validate_package(workout_type, data)
+    assert reason is not None and field in reason
+
+
+def test_validate_columns():
+    packages = [('RUN', [1206, 12, 6]),
+                ('RUN', [1206, 0, 6]),
+                ('XXX', [1, 1, 1]),
+                ('WLK', [9000, 1, 75, -180]),
+                ('SWM', [720, 1, 80, 25, 40])]
+    workout_types, columns = batch.packages_to_columns(packages)
+    mask, reasons = validation.validate_columns(workout_types, columns)
+    assert list(mask) == [1, 0, 0, 0, 1]
+    assert sorted(reasons) == [1, 2, 3]
+
+
+@pytest.mark.skipif(batch.load_numpy() is None,
+                    reason='NumPy не установлен')
+def test_validate_columns_numpy_matches_python():
+    packages = [('RUN', [1206, 12, 6]),
+                ('RUN', [math.nan, 12, 6]),
+                ('RUN', [1206, 0, 6]),
+                ('RUN', [1206, 12, 0]),
+                ('XXX', [1, 1, 1]),
+                ('WLK', [9000, 1, 75, 0]),
+                ('WLK', [9000, 1, -75, math.inf]),
+                ('SWM', [720, 1, 80, 25, 40]),
+                ('SWM', [720, 1, 80, 0, -math.inf])]
+    workout_types, columns = batch.packages_to_columns(packages)
+    numpy_result = validation.validate_columns(workout_types, columns)
+    python_result = validation._validate_columns_python(workout_types,
+                                                        columns)
+    assert numpy_result == python_result
+    assert list(numpy_result[0]) == [1, 0, 0, 1, 0, 0, 0, 1, 0]
+
+
+def test_validate_columns_agrees_with_validate_package():
+    packages = [('RUN', [1206, 12, 6]),
+                ('RUN', [True, 12, 6]),
+                ('RUN', [10 ** 400, 12, 6]),
+                (['RUN'], [1206, 12, 6])]
+    workout_types = [workout_type for workout_type, _ in packages]
+    columns = [list(column) for column in zip(*(data for _, data
+                                                in packages))]
+    mask, reasons = validation.validate_columns(workout_types, columns)
+    assert list(mask) == [
+        validation.validate_package(*package) is None
+        for package in packages
+    ]
+
+
+def test_dead_letter_and_fast_path():
+    packages = [('RUN', [1206, 12, 6]),
+                ('RUN', [1206, 0, 6]),
+                ('WLK', [9000, 1, 75, 180])]
+    sink = sinks.MemorySink()
+    dead_letter = validation.DeadLetter(sink)
+    trainings = list(validation.read_valid_packages(packages, dead_letter))
+    assert [type(training) for training in trainings] == [
+        homework.Running, homework.SportsWalking,
+    ]
+    assert dead_letter.count == 1
+    assert '"reason": "duration' in sink.getvalue()
@@ -0,0 +1,242 @@
+"""Проверка пакетов до создания объектов тренировок."""
+import json
+import math
+from numbers import Real
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple)
+
+from batch import load_numpy
+from homework import WORKOUT_FACTORIES, WORKOUT_FIELDS, InfoMessage, Training
+from sinks import Sink
+
+Package = Tuple[str, Sequence[Any]]
+
+# Поля, которые должны быть строго положительными: на них делят.
+POSITIVE_FIELDS: Tuple[str, ...] = ('duration', 'height')
+
+
+def _is_number(value: Any) -> bool:
+    if not isinstance(value, Real) or isinstance(value, bool):
+        return False
+    try:
+        return math.isfinite(value)
+    except OverflowError:
+        # Целые из JSON вроде 10**400 не помещаются во float.
+        return False
+
+
+def _workout_fields(workout_type: Any) -> Optional[Tuple[str, ...]]:
+    if not isinstance(workout_type, str):
+        return None
+    return WORKOUT_FIELDS.get(workout_type)
+
+
+def validate_package(workout_type: Any, data: Any) -> Optional[str]:
+    """Причина отказа для пакета или `None`, если пакет корректен."""
+    fields: Optional[Tuple[str, ...]] = _workout_fields(workout_type)
+    if fields is None:
+        return f'неизвестный код тренировки: {workout_type!r}'
+    if not isinstance(data, (list, tuple)):
+        return 'данные пакета должны быть списком'
+    if len(data) != len(fields):
+        return (f'ожидается {len(fields)} значений '
+                f'({", ".join(fields)}), получено {len(data)}')
+    for name, value in zip(fields, data):
+        if not _is_number(value):
+            return f'{name}: ожидается конечное число, получено {value!r}'
+        if value < 0 or (value == 0 and name in POSITIVE_FIELDS):
+            sign: str = 'положительным' if name in POSITIVE_FIELDS else (
+                'неотрицательным')
+            return f'{name}: значение должно быть {sign}, получено {value!r}'
+    return None
+
+
+def _value_reason(name: str, value: Any, finite: bool) -> str:
+    if not finite:
+        return f'{name}: ожидается конечное число, получено {value!r}'
+    return f'{name}: недопустимое значение {value!r}'
+
+
+def validate_columns(workout_types: Sequence[str],
+                     columns: Sequence[Sequence[float]],
+                     ) -> Tuple[bytearray, Dict[int, str]]:
+    """Проверить сразу весь набор пакетов, разложенный по колонкам.
+
+    Колонки — как у `batch.compute_batch`: i-я колонка содержит i-е
+    поле всех пакетов. Проверки выполняются по колонке целиком и дают
+    маски; возвращается маска корректных строк (1/0) и причины отказа
+    по номерам строк. Число полей по колонкам не восстановить, его
+    проверяет `validate_package`.
+
+    Колонки-массивы (`array`, `memoryview`, `numpy.ndarray`) при
+    установленном NumPy проверяются векторно. В списках могут лежать
+    любые объекты, например `True`, поэтому они проверяются по
+    элементам.
+    """
+    numpy = load_numpy()
+    if numpy is not None and not any(isinstance(column, (list, tuple))
+                                     for column in columns):
+        return _validate_columns_numpy(numpy, workout_types, columns)
+    return _validate_columns_python(workout_types, columns)
+
+
+def _validate_columns_python(workout_types: Sequence[str],
+                             columns: Sequence[Sequence[float]],
+                             ) -> Tuple[bytearray, Dict[int, str]]:
+    size: int = len(workout_types)
+    mask: bytearray = bytearray(b'\x01') * size
+    reasons: Dict[int, str] = {}
+
+    def reject(index: int, reason: str) -> None:
+        if mask[index]:
+            mask[index] = 0
+            reasons[index] = reason
+
+    field_sets: List[Optional[Tuple[str, ...]]] = [
+        _workout_fields(workout_type) for workout_type in workout_types
+    ]
+    for index, fields in enumerate(field_sets):
+        if fields is None:
+            reject(index, 'неизвестный код тренировки: '
+                          f'{workout_types[index]!r}')
+    for position, column in enumerate(columns):
+        finite: List[bool] = [_is_number(value) for value in column]
+        negative: List[bool] = [ok and value < 0
+                                for ok, value in zip(finite, column)]
+        zero: List[bool] = [ok and value == 0
+                            for ok, value in zip(finite, column)]
+        for index in range(size):
+            fields = field_sets[index]
+            if not mask[index] or position >= len(fields):
+                continue
+            name: str = fields[position]
+            if (not finite[index] or negative[index]
+                    or (zero[index] and name in POSITIVE_FIELDS)):
+                reject(index, _value_reason(name, column[index],
+                                            finite[index]))
+    return mask, reasons
+
+
+def _validate_columns_numpy(numpy: Any, workout_types: Sequence[str],
+                            columns: Sequence[Sequence[float]],
+                            ) -> Tuple[bytearray, Dict[int, str]]:
+    """Маски по колонкам через NumPy; цикл только по отклонённым строкам.
+
+    Для каждого кода тренировки заранее известно, есть ли у него поле
+    в данной колонке и должно ли оно быть положительным, поэтому эти
+    признаки раскладываются по строкам индексированием таблиц.
+    """
+    size: int = len(workout_types)
+    codes: List[str] = list(WORKOUT_FIELDS)
+    code_indexes: Dict[str, int] = {code: index
+                                    for index, code in enumerate(codes)}
+    unknown: int = len(codes)
+    rows = numpy.fromiter(
+        (code_indexes.get(workout_type, unknown)
+         if isinstance(workout_type, str) else unknown
+         for workout_type in workout_types),
+        dtype=numpy.intp, count=size,
+    )
+    reasons: Dict[int, str] = {
+        int(index): f'неизвестный код тренировки: {workout_types[index]!r}'
+        for index in numpy.flatnonzero(rows == unknown)
+    }
+    valid = rows != unknown
+    for position, column in enumerate(columns):
+        names: List[Optional[str]] = [
+            fields[position] if position < len(fields) else None
+            for fields in WORKOUT_FIELDS.values()
+        ] + [None]
+        present = numpy.array([name is not None for name in names])[rows]
+        positive = numpy.array([name in POSITIVE_FIELDS
+                                for name in names])[rows]
+        values = numpy.asarray(column, dtype=numpy.float64)
+        finite = numpy.isfinite(values)
+        with numpy.errstate(invalid='ignore'):
+            bad = ~finite | (values < 0) | ((values == 0) & positive)
+        bad &= valid & present
+        for index in numpy.flatnonzero(bad):
+            reasons[int(index)] = _value_reason(
+                names[rows[index]], float(values[index]),
+                bool(finite[index]),
+            )
+        valid &= ~bad
+    return bytearray(valid.astype(numpy.uint8).tobytes()), reasons
+
+
+class DeadLetter:
+    """Сборщик отклонённых пакетов с причинами.
+
+    Если передан `sink`, каждый отказ пишется в него строкой JSON
+    `{"workout_type": ..., "data": ..., "reason": ...}`; иначе отказы
+    копятся в `rejects`.
+    """
+
+    def __init__(self, sink: Optional[Sink] = None) -> None:
+        self.sink: Optional[Sink] = sink
+        self.rejects: List[Tuple[Any, Any, str]] = []
+        self.count: int = 0
+
+    def add(self, workout_type: Any, data: Any, reason: str) -> None:
+        """Учесть отклонённый пакет."""
+        self.count += 1
+        if self.sink is None:
+            self.rejects.append((workout_type, data, reason))
+            return
+        self.sink.write(json.dumps({'workout_type': workout_type,
+                                    'data': data,
+                                    'reason': reason,
+                                    }, ensure_ascii=False, default=repr)
+                        + '\n')
+
+    def add_unreadable(self, record: Any, error: Exception) -> None:
+        """Учесть строку входных данных, которую не удалось разобрать."""
+        self.add(None, record, f'{type(error).__name__}: {error}')
+
+    def close(self) -> None:
+        """Закрыть получателя отказов."""
+        if self.sink is not None:
+            self.sink.close()
+
+
+def iter_valid(packages: Iterable[Package],
+               dead_letter: DeadLetter) -> Iterator[Package]:
+    """Пропустить корректные пакеты, отправив остальные в `dead_letter`."""
+    for workout_type, data in packages:
+        reason: Optional[str] = validate_package(workout_type, data)
+        if reason is None:
+            yield workout_type, data
+        else:
+            dead_letter.add(workout_type, data, reason)
+
+
+def read_valid_packages(packages: Iterable[Package],
+                        dead_letter: DeadLetter) -> Iterator[Training]:
+    """Создать тренировки из проверенных пакетов без повторных проверок.
+
+    После проверки объекты создаются напрямую фабриками реестра,
+    минуя поиск кода и разбор ошибок в `read_package`.
+    """
+    factories = WORKOUT_FACTORIES
+    for workout_type, data in iter_valid(packages, dead_letter):
+        yield factories[workout_type](*data)
+
+
+def iter_valid_infos(packages: Iterable[Package],
+                     dead_letter: DeadLetter) -> Iterator[InfoMessage]:
+    """Рассчитать проверенные пакеты, не прерываясь на ошибках расчёта.
+
+    Корректный по схеме пакет всё ещё может переполнить формулу
+    (например, `speed ** 2` у ходьбы) — такие пакеты с причиной уходят
+    в `dead_letter`.
+    """
+    factories = WORKOUT_FACTORIES
+    for workout_type, data in iter_valid(packages, dead_letter):
+        try:
+            info: InfoMessage = factories[workout_type](
+                *data).show_training_info()
+        except ArithmeticError as error:
+            dead_letter.add(workout_type, data,
+                            f'расчёт: {type(error).__name__}: {error}')
+        else:
+            yield info